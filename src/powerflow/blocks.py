@@ -4,6 +4,8 @@ This module provides functions to create visually stunning Notion blocks
 following Michelin-star attention to detail.
 """
 
+from collections.abc import Iterator
+from functools import lru_cache
 
 # Priority-based visual styling
 PRIORITY_STYLES = {
@@ -13,8 +15,14 @@ PRIORITY_STYLES = {
     None: {"icon": "💡", "color": "default"},
 }
 
+# Notion caps rich_text content at 2000 chars; leave headroom for the ellipsis
+MAX_RICH_TEXT_LENGTH = 1900
 
-def safe_text(text: str, max_length: int = 1900) -> str:
+# Block type keys for create_heading, indexed by level - 1
+_HEADING_KEYS = ("heading_1", "heading_2", "heading_3")
+
+
+def safe_text(text: str, max_length: int = MAX_RICH_TEXT_LENGTH) -> str:
     """Safely truncate text for Notion's 2000 char limit per rich_text block."""
     if not text:
         return ""
@@ -29,17 +37,27 @@ def format_duration(seconds: int) -> str:
         return "Unknown"
     if seconds < 60:
         return f"0:{seconds:02d}"
-    minutes, secs = divmod(seconds, 60)
+    minutes = seconds // 60
+    secs = seconds % 60
     if minutes < 60:
         return f"{minutes}:{secs:02d}"
-    hours, mins = divmod(minutes, 60)
-    return f"{hours}:{mins:02d}:{secs:02d}"
+    return f"{minutes // 60}:{minutes % 60:02d}:{secs:02d}"
+
+
+def _plain_rich_text(content: str) -> dict:
+    """Create an unstyled rich text object (no annotations, no link)."""
+    if not content or len(content) > MAX_RICH_TEXT_LENGTH:
+        content = safe_text(content)
+    return {"type": "text", "text": {"content": content}}
 
 
 def create_rich_text(content: str, bold: bool = False, italic: bool = False,
                      color: str = "default", link: str | None = None) -> dict:
     """Create a rich text object with optional styling."""
-    text_obj = {"content": safe_text(content)}
+    # Short non-empty content is by far the common case; skip the safe_text call
+    if not content or len(content) > MAX_RICH_TEXT_LENGTH:
+        content = safe_text(content)
+    text_obj = {"content": content}
     if link:
         text_obj["link"] = {"url": link}
 
@@ -76,7 +94,7 @@ def create_callout(
         "callout": {
             "icon": {"type": "emoji", "emoji": icon},
             "color": color,
-            "rich_text": [create_rich_text(text)]
+            "rich_text": [_plain_rich_text(text)]
         }
     }
 
@@ -91,7 +109,7 @@ def create_toggle(title: str, children: list[dict]) -> dict:
     return {
         "type": "toggle",
         "toggle": {
-            "rich_text": [create_rich_text(title)],
+            "rich_text": [_plain_rich_text(title)],
             "children": children
         }
     }
@@ -107,9 +125,9 @@ def create_bullet(text: str, bold_prefix: str | None = None) -> dict:
 
     if bold_prefix:
         rich_text.append(create_rich_text(f"{bold_prefix}: ", bold=True))
-        rich_text.append(create_rich_text(text))
+        rich_text.append(_plain_rich_text(text))
     else:
-        rich_text.append(create_rich_text(text))
+        rich_text.append(_plain_rich_text(text))
 
     return {
         "type": "bulleted_list_item",
@@ -134,7 +152,7 @@ def create_quote(text: str, color: str = "default") -> dict:
     return {
         "type": "quote",
         "quote": {
-            "rich_text": [create_rich_text(text)],
+            "rich_text": [_plain_rich_text(text)],
             "color": color
         }
     }
@@ -145,7 +163,7 @@ def create_todo(text: str, checked: bool = False) -> dict:
     return {
         "type": "to_do",
         "to_do": {
-            "rich_text": [create_rich_text(text)],
+            "rich_text": [_plain_rich_text(text)],
             "checked": checked,
             "color": "default"
         }
@@ -154,19 +172,19 @@ def create_todo(text: str, checked: bool = False) -> dict:
 
 def create_heading(text: str, level: int = 2, color: str = "default") -> dict:
     """Create a heading block (level 1, 2, or 3)."""
-    level = max(1, min(3, level))  # Clamp to 1-3
-    heading_key = f"heading_{level}"
+    heading_key = _HEADING_KEYS[max(1, min(3, level)) - 1]  # Clamp to 1-3
 
     return {
         "type": heading_key,
         heading_key: {
-            "rich_text": [create_rich_text(text)],
+            "rich_text": [_plain_rich_text(text)],
             "color": color,
             "is_toggleable": False
         }
     }
 
 
+@lru_cache(maxsize=16)
 def get_priority_style(priority: str | None) -> dict:
     """Get the visual style for a given priority level."""
     # Normalize priority string
@@ -183,35 +201,47 @@ def parse_bold_segments(text: str) -> list[dict]:
     Example: "Hello **world** and **foo**"
     Returns: [{"text": "Hello "}, {"text": "world", bold}, {"text": " and "}, {"text": "foo", bold}]
     """
-    import re
-    rich_text = []
+    # Most lines have no bold markers - skip the scan entirely
+    if "**" not in text:
+        return [_plain_rich_text(text)]
 
-    # Pattern matches **text**
-    pattern = r'\*\*([^*]+)\*\*'
+    rich_text = []
     last_end = 0
+    search_from = 0
+
+    # Scan for **text** spans with str.find (same matches as r'\*\*([^*]+)\*\*')
+    while True:
+        start = text.find("**", search_from)
+        if start < 0:
+            break
+        end = text.find("**", start + 2)
+        if end < 0:
+            break
+
+        bold_text = text[start + 2:end]
+        if not bold_text or "*" in bold_text:
+            # Not a valid span at this position, retry one char later
+            search_from = start + 1
+            continue
 
-    for match in re.finditer(pattern, text):
         # Add text before the match (non-bold)
-        if match.start() > last_end:
-            before = text[last_end:match.start()]
-            if before:
-                rich_text.append(create_rich_text(before))
+        if start > last_end:
+            rich_text.append(_plain_rich_text(text[last_end:start]))
 
         # Add the bold text
-        bold_text = match.group(1)
         rich_text.append(create_rich_text(bold_text, bold=True))
 
-        last_end = match.end()
+        last_end = search_from = end + 2
 
     # Add remaining text after last match
     if last_end < len(text):
         remaining = text[last_end:]
         if remaining:
-            rich_text.append(create_rich_text(remaining))
+            rich_text.append(_plain_rich_text(remaining))
 
     # If no matches, return the whole text as-is
     if not rich_text:
-        rich_text.append(create_rich_text(text))
+        rich_text.append(_plain_rich_text(text))
 
     return rich_text
 
@@ -237,49 +267,48 @@ def parse_markdown_to_blocks(markdown: str) -> list[dict]:
 
     Returns a list of Notion block objects.
     """
-    if not markdown:
-        return []
+    return list(iter_markdown_blocks(markdown))
 
-    blocks = []
-    lines = markdown.strip().split('\n')
 
-    for line in lines:
-        line = line.rstrip()
+def iter_markdown_blocks(markdown: str) -> Iterator[dict]:
+    """Yield Notion blocks for markdown one line at a time.
+
+    Generator form of parse_markdown_to_blocks, for callers that extend an
+    existing list and don't need a copy of their own.
+    """
+    # isspace() checks without allocating a stripped copy
+    if not markdown or markdown.isspace():
+        return
+
+    for line in markdown.splitlines():
+        # Strip once per line; all classification works on the stripped text
+        stripped = line.strip()
 
         # Skip empty lines
-        if not line.strip():
+        if not stripped:
             continue
 
-        # Heading (### text)
-        if line.startswith('### '):
-            heading_text = line[4:].strip()
-            blocks.append({
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": parse_bold_segments(heading_text),
-                    "color": "default",
-                    "is_toggleable": False
-                }
-            })
-
-        # Bullet point (- text or  - text for indented)
-        elif line.lstrip().startswith('- '):
-            # Remove leading whitespace and the "- "
-            bullet_text = line.lstrip()[2:].strip()
-            blocks.append({
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {
-                    "rich_text": parse_bold_segments(bullet_text)
-                }
-            })
-
-        # Regular paragraph
+        if stripped.startswith('### '):
+            # Heading (### text)
+            block_type = "heading_3"
+            content = stripped[4:].lstrip()
+        elif stripped.startswith('- '):
+            # Bullet point (- text or  - text for indented)
+            block_type = "bulleted_list_item"
+            content = stripped[2:].lstrip()
         else:
-            blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": parse_bold_segments(line)
-                }
-            })
-
-    return blocks
+            # Regular paragraph
+            block_type = "paragraph"
+            content = stripped
+
+        # Plain, short lines (the common case) skip the rich text helpers
+        if "**" in content or len(content) > MAX_RICH_TEXT_LENGTH:
+            rich_text = parse_bold_segments(content)
+        else:
+            rich_text = [{"type": "text", "text": {"content": content}}]
+
+        body: dict = {"rich_text": rich_text}
+        if block_type == "heading_3":
+            body["color"] = "default"
+            body["is_toggleable"] = False
+        yield {"type": block_type, block_type: body}
@@ -14,20 +14,26 @@ UX Principles:
 - Exit codes for scripting (0=success, 1=error)
 """
 
-import os
-import sys
+from __future__ import annotations
 
-import requests
+import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from .config import (
     CONFIG_FILE,
     Config,
+    get_notion_api_key,
+    get_pocket_api_key,
 )
-from .notion import NotionClient
-from .pocket import PocketClient
-from .sync import SyncEngine
 from .utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from .notion import NotionClient
+
+# API clients (and requests) are imported inside the commands that need them,
+# so `powerflow --help`, `config` and `daemon status` start without loading them.
+
 logger = get_logger(__name__)
 
 # =============================================================================
@@ -49,9 +55,14 @@ def print_info(msg: str) -> None:
     print(f"ℹ️  {msg}")
 
 
+def format_warning(msg: str) -> str:
+    """Format a warning message, for reports built up before printing."""
+    return f"⚠️  {msg}"
+
+
 def print_warning(msg: str) -> None:
     """Print warning message."""
-    print(f"⚠️  {msg}")
+    print(format_warning(msg))
 
 
 def print_step(msg: str, end: str = "... ") -> None:
@@ -73,13 +84,14 @@ def get_or_prompt_pocket_key(config: Config) -> str | None:
     3. Interactive prompt
     """
     # Check environment first
-    key = os.getenv("POCKET_API_KEY")
+    key = get_pocket_api_key()
     if key:
         return key
 
-    # Check config
-    if hasattr(config, 'pocket_api_key') and config.pocket_api_key:
-        return config.pocket_api_key
+    # Check config (older configs may not have the attribute)
+    key = getattr(config, "pocket_api_key", None)
+    if key:
+        return key
 
     # Prompt user
     print()
@@ -107,13 +119,14 @@ def get_or_prompt_notion_key(config: Config) -> str | None:
     3. Interactive prompt
     """
     # Check environment first
-    key = os.getenv("NOTION_API_KEY")
+    key = get_notion_api_key()
     if key:
         return key
 
-    # Check config
-    if hasattr(config, 'notion_api_key') and config.notion_api_key:
-        return config.notion_api_key
+    # Check config (older configs may not have the attribute)
+    key = getattr(config, "notion_api_key", None)
+    if key:
+        return key
 
     # Prompt user
     print()
@@ -177,9 +190,14 @@ def verify_pocket_key(key: str) -> tuple[bool, str]:
     if not valid:
         return False, error
 
+    import requests
+
+    from .pocket import PocketClient
+
     try:
-        client = PocketClient(key)
-        client.get_recordings_list(limit=1)
+        # Only needed for this check, so release its connections afterwards
+        with PocketClient(key) as client:
+            client.get_recordings_list(limit=1)
         logger.debug("Pocket API key verified successfully")
         return True, ""
     except requests.exceptions.HTTPError as e:
@@ -202,46 +220,121 @@ def verify_pocket_key(key: str) -> tuple[bool, str]:
         return False, f"Network error: {e}"
 
 
-def verify_notion_key(key: str) -> tuple[bool, str]:
+def verify_notion_key(key: str) -> tuple[bool, str, NotionClient | None, list[dict]]:
     """Verify Notion API key works.
 
+    Verification lists the accessible databases, so the result is returned
+    for setup to use instead of searching a second time.
+
     Returns:
-        (success, error_message)
+        (success, error_message, client, databases) - client is the verified
+        NotionClient on success so callers can reuse its session
     """
     # Validate format first (fast, no network)
     valid, error = validate_notion_key_format(key)
     if not valid:
-        return False, error
+        return False, error, None, []
+
+    import requests
+
+    from .notion import NotionClient
 
     try:
         client = NotionClient(key)
-        client.search_databases()
+        databases = client.search_databases()
         logger.debug("Notion API key verified successfully")
-        return True, ""
+        return True, "", client, databases
     except requests.exceptions.HTTPError as e:
         logger.warning("Notion key verification failed: %s", e)
         status = e.response.status_code if e.response is not None else None
         if status == 401:
-            return False, "Invalid API key. Please check and try again."
+            return False, "Invalid API key. Please check and try again.", None, []
         elif status == 403:
-            return False, "API key doesn't have permission. Check your integration settings."
+            error = "API key doesn't have permission. Check your integration settings."
+            return False, error, None, []
         else:
-            return False, f"API error (HTTP {status}): {e}"
+            return False, f"API error (HTTP {status}): {e}", None, []
     except requests.exceptions.ConnectionError:
         logger.warning("Notion connection failed during verification")
-        return False, "Can't connect to Notion API. Check your internet connection."
+        return False, "Can't connect to Notion API. Check your internet connection.", None, []
     except requests.exceptions.Timeout:
         logger.warning("Notion verification timed out")
-        return False, "Connection timed out. Check your internet connection."
+        return False, "Connection timed out. Check your internet connection.", None, []
     except requests.exceptions.RequestException as e:
         logger.warning("Notion verification request error: %s", e)
-        return False, f"Network error: {e}"
+        return False, f"Network error: {e}", None, []
 
 
 # =============================================================================
 # SETUP COMMAND
 # =============================================================================
 
+# Property mapping candidates, checked in order:
+# (pocket field, property_map key, Notion names to look for, required type,
+#  name to create if missing). Priority and Due Date are optional and never created.
+FIELD_CANDIDATES: list[tuple[str, str, tuple[str, ...], str, str | None]] = [
+    ("Priority", "priority", ("Priority",), "select", None),
+    ("Due Date", "due_date", ("Due Date", "Due", "DueDate"), "date", None),
+    # CRITICAL: pocket_id is required for deduplication
+    ("pocket_id", "pocket_id", ("Inbox ID", "pocket_id", "Pocket ID", "Source ID"),
+     "rich_text", "Inbox ID"),
+    # Context must be rich_text, NOT relation
+    ("Context", "context", ("Next step", "Notes", "Description", "Details"),
+     "rich_text", "Action Context"),
+    ("Source", "source_url", ("Source", "URL", "Link", "Recording"), "url", "Source"),
+    ("Tags", "tags", ("Tags", "Labels", "Categories"), "multi_select", "Tags"),
+]
+
+# Reverse lookup: casefolded Notion property name -> (pocket field, required type, rank)
+FIELD_ALIASES: dict[str, tuple[str, str, int]] = {
+    name.casefold(): (pocket_field, prop_type, rank)
+    for pocket_field, _, candidates, prop_type, _ in FIELD_CANDIDATES
+    for rank, name in enumerate(candidates)
+}
+
+# Pocket field -> key in the saved property_map
+PROPERTY_MAP_KEYS: dict[str, str] = {
+    pocket_field: config_key for pocket_field, config_key, *_ in FIELD_CANDIDATES
+}
+
+
+def plan_property_mapping(
+    schema: dict[str, dict],
+) -> tuple[list[tuple[str, str, str]], list[tuple[str, str, str]]]:
+    """Match Pocket fields against a Notion database schema.
+
+    We need: title, pocket_id (dedup), priority, due_date, context, source, tags
+
+    Returns:
+        (existing_mappings, to_create) as lists of
+        (pocket_field, notion_field, "existing" | property_type)
+    """
+    # Single pass over the schema, keeping the best-ranked candidate per field.
+    # Names match case-insensitively; the schema's own spelling is kept.
+    found: dict[str, tuple[int, str]] = {}
+    for name, prop in schema.items():
+        alias = FIELD_ALIASES.get(name.casefold())
+        if alias is None:
+            continue
+        pocket_field, prop_type, rank = alias
+        if prop.get("type") != prop_type:
+            continue
+        if pocket_field not in found or rank < found[pocket_field][0]:
+            found[pocket_field] = (rank, name)
+
+    # Title always exists in Notion databases
+    existing_mappings = [("Action Item", "Name", "existing")]
+    to_create = []
+
+    for pocket_field, _, _, prop_type, create_name in FIELD_CANDIDATES:
+        if pocket_field in found:
+            existing_mappings.append((pocket_field, found[pocket_field][1], "existing"))
+        elif create_name:
+            to_create.append((pocket_field, create_name, prop_type))
+
+    return existing_mappings, to_create
+
+
 def cmd_setup() -> int:
     """
     Interactive setup wizard.
@@ -257,6 +350,8 @@ def cmd_setup() -> int:
 
     This is idempotent - can be run multiple times safely.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
     print("\n🚀 Power-Flow Setup\n")
 
     config = Config.load()
@@ -268,41 +363,33 @@ def cmd_setup() -> int:
         print("   Set POCKET_API_KEY environment variable or enter it when prompted.")
         return 1
 
-    # Step 2: Verify Pocket key
-    print_step("Checking Pocket API")
-    success, error = verify_pocket_key(pocket_key)
-    if not success:
-        print("❌")
-        print_error(error)
-        return 1
-    print("✓")
-
-    # Step 3: Get Notion API key
+    # Step 2: Get Notion API key
     notion_key = get_or_prompt_notion_key(config)
     if not notion_key:
         print_error("Notion API key is required.")
         print("   Set NOTION_API_KEY environment variable or enter it when prompted.")
         return 1
 
-    # Step 4: Verify Notion key
-    print_step("Checking Notion API")
-    success, error = verify_notion_key(notion_key)
-    if not success:
+    # Step 3-4: Verify both keys (independent network calls, so run them together)
+    print_step("Checking Pocket and Notion APIs")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pocket_future = executor.submit(verify_pocket_key, pocket_key)
+        notion_future = executor.submit(verify_notion_key, notion_key)
+        pocket_ok, pocket_error = pocket_future.result()
+        notion_ok, notion_error, notion, databases = notion_future.result()
+
+    if not (pocket_ok and notion_ok):
         print("❌")
-        print_error(error)
+        if not pocket_ok:
+            print_error(f"Pocket: {pocket_error}")
+        if not notion_ok:
+            print_error(f"Notion: {notion_error}")
         return 1
+    assert notion is not None  # verify_notion_key returns a client on success
     print("✓")
 
-    # Step 5: Discover databases
-    print("\n📚 Scanning for accessible databases...\n")
-    notion = NotionClient(notion_key)
-
-    try:
-        databases = notion.search_databases()
-    except Exception as e:
-        print_error(f"Failed to list databases: {e}")
-        return 1
-
+    # Step 5: Discover databases (already listed while verifying the key)
+    print()
     formatted = notion.format_databases_for_display(databases)
 
     if not formatted:
@@ -316,10 +403,11 @@ def cmd_setup() -> int:
         return 1
 
     # Step 6: Display databases and get selection
-    print("Found databases:")
-    for i, db in enumerate(formatted, 1):
-        print(f"  {i}. {db['emoji']} {db['title']}")
-    print(f"  {len(formatted) + 1}. [Enter ID manually]")
+    # Build the whole list first and write it once (workspaces can have many databases)
+    lines = ["Found databases:"]
+    lines.extend(f"  {i}. {db['emoji']} {db['title']}" for i, db in enumerate(formatted, 1))
+    lines.append(f"  {len(formatted) + 1}. [Enter ID manually]")
+    print("\n".join(lines))
 
     # Get user selection
     selected = None
@@ -366,82 +454,21 @@ def cmd_setup() -> int:
         print_error(f"Failed to get database schema: {e}")
         return 1
 
-    schema_names = {name: prop.get("type") for name, prop in schema.items()}
-
-    # Build property mapping
-    # We need: title, pocket_id (dedup), priority, due_date, context, source
-    existing_mappings = []
-    to_create = []
-
-    # Title always exists in Notion databases
-    existing_mappings.append(("Action Item", "Name", "existing"))
-
-    # Check for Priority (select type)
-    if "Priority" in schema_names and schema_names["Priority"] == "select":
-        existing_mappings.append(("Priority", "Priority", "existing"))
-
-    # Check for Due Date (date type)
-    for name in ["Due Date", "Due", "DueDate"]:
-        if name in schema_names and schema_names[name] == "date":
-            existing_mappings.append(("Due Date", name, "existing"))
-            break
-
-    # Check for pocket_id field (rich_text for deduplication)
-    # CRITICAL: This is required for deduplication
-    pocket_id_field = None
-    for name in ["Inbox ID", "pocket_id", "Pocket ID", "Source ID"]:
-        if name in schema_names and schema_names[name] == "rich_text":
-            pocket_id_field = name
-            existing_mappings.append(("pocket_id", name, "existing"))
-            break
-
-    if not pocket_id_field:
-        # Must create this field - it's required for deduplication
-        to_create.append(("pocket_id", "Inbox ID", "rich_text"))
-
-    # Check for context field (rich_text, NOT relation)
-    context_field = None
-    for name in ["Next step", "Notes", "Description", "Details"]:
-        if name in schema_names and schema_names[name] == "rich_text":
-            context_field = name
-            existing_mappings.append(("Context", name, "existing"))
-            break
-
-    if not context_field:
-        # Context field not found - create it
-        to_create.append(("Context", "Action Context", "rich_text"))
-
-    # Check for source URL field
-    source_field = None
-    for name in ["Source", "URL", "Link", "Recording"]:
-        if name in schema_names and schema_names[name] == "url":
-            source_field = name
-            existing_mappings.append(("Source", name, "existing"))
-            break
-
-    if not source_field:
-        to_create.append(("Source", "Source", "url"))
-
-    # Check for tags field (multi_select)
-    tags_field = None
-    for name in ["Tags", "Labels", "Categories"]:
-        if name in schema_names and schema_names[name] == "multi_select":
-            tags_field = name
-            existing_mappings.append(("Tags", name, "existing"))
-            break
-
-    if not tags_field:
-        to_create.append(("Tags", "Tags", "multi_select"))
+    existing_mappings, to_create = plan_property_mapping(schema)
 
     # Display mapping
-    print("Mapping Pocket → Notion:\n")
-    for pocket_field, notion_field, _ in existing_mappings:
-        print(f"   ✅ {pocket_field:15} → {notion_field}")
-
+    lines = ["Mapping Pocket → Notion:\n"]
+    lines.extend(
+        f"   ✅ {pocket_field:15} → {notion_field}"
+        for pocket_field, notion_field, _ in existing_mappings
+    )
     if to_create:
-        print()
-        for pocket_field, notion_field, _ in to_create:
-            print(f"   ➕ {pocket_field:15} → {notion_field} [will create]")
+        lines.append("")
+        lines.extend(
+            f"   ➕ {pocket_field:15} → {notion_field} [will create]"
+            for pocket_field, notion_field, _ in to_create
+        )
+    print("\n".join(lines))
 
     # Step 8: Confirm and create properties
     if to_create:
@@ -457,39 +484,27 @@ def cmd_setup() -> int:
             print("Run setup again when ready.")
             return 1
 
-        # Create properties
+        # Create all missing properties in one database update
         print()
-        for _, prop_name, prop_type in to_create:
-            print_step(f"Creating {prop_name}")
-            try:
-                notion.create_property(selected["id"], prop_name, prop_type)
-                print("✓")
-            except Exception as e:
-                print("❌")
-                print_error(f"Failed to create property: {e}")
-                return 1
+        print_step(f"Creating {', '.join(prop_name for _, prop_name, _ in to_create)}")
+        try:
+            notion.create_properties(
+                selected["id"],
+                [(prop_name, prop_type) for _, prop_name, prop_type in to_create],
+            )
+            print("✓")
+        except Exception as e:
+            print("❌")
+            print_error(f"Failed to create properties: {e}")
+            return 1
 
     # Step 9: Build and save configuration
     property_map = {"title": "Name"}
 
-    # Add mappings from existing
-    field_mapping = {
-        "Priority": "priority",
-        "Due Date": "due_date",
-        "pocket_id": "pocket_id",
-        "Context": "context",
-        "Source": "source_url",
-        "Tags": "tags",
-    }
-
-    for pocket_field, notion_field, _ in existing_mappings:
-        if pocket_field in field_mapping:
-            property_map[field_mapping[pocket_field]] = notion_field
-
-    # Add mappings from created
-    for pocket_field, notion_field, _ in to_create:
-        if pocket_field in field_mapping:
-            property_map[field_mapping[pocket_field]] = notion_field
+    # Add mappings from existing and created properties
+    for pocket_field, notion_field, _ in existing_mappings + to_create:
+        if pocket_field in PROPERTY_MAP_KEYS:
+            property_map[PROPERTY_MAP_KEYS[pocket_field]] = notion_field
 
     # Ensure pocket_id is always mapped (CRITICAL for dedup)
     if "pocket_id" not in property_map:
@@ -528,9 +543,11 @@ def cmd_sync(dry_run: bool = False) -> int:
     Each recording becomes an Inbox item for triage (task, note, project, archive).
     CRITICAL: Never create duplicates. Always check before creating.
     """
+    from .sync import get_engine
+
     # Get API keys
-    pocket_key = os.getenv("POCKET_API_KEY")
-    notion_key = os.getenv("NOTION_API_KEY")
+    pocket_key = get_pocket_api_key()
+    notion_key = get_notion_api_key()
 
     if not pocket_key:
         print_error("Pocket API key not found.")
@@ -551,14 +568,11 @@ def cmd_sync(dry_run: bool = False) -> int:
 
     # Initialize clients
     try:
-        pocket = PocketClient(pocket_key)
-        notion = NotionClient(notion_key)
+        engine = get_engine(config, pocket_key, notion_key)
     except Exception as e:
         print_error(f"Failed to initialize API clients: {e}")
         return 1
 
-    engine = SyncEngine(pocket, notion, config)
-
     # Run sync
     mode = "[DRY RUN] " if dry_run else ""
     print(f"\n🔄 {mode}Syncing Pocket → Notion ({config.notion.database_name})...\n")
@@ -592,40 +606,49 @@ def cmd_sync(dry_run: bool = False) -> int:
 # STATUS COMMAND
 # =============================================================================
 
-def cmd_status() -> int:
-    """Show sync status and pending item count."""
+def cmd_status(fresh: bool = False) -> int:
+    """Show sync status and pending item count.
+
+    Args:
+        fresh: Skip the cached pending count and query the APIs
+    """
     config = Config.load()
 
-    print("\n📊 Power-Flow Status\n")
+    # Collect the static part of the report and write it in one call
+    lines = ["", "📊 Power-Flow Status", ""]
 
     if not config.is_configured:
-        print_warning("Not configured.")
-        print("   Run 'powerflow setup' to get started.")
+        lines.append(format_warning("Not configured."))
+        lines.append("   Run 'powerflow setup' to get started.")
+        print("\n".join(lines))
         return 0
 
-    print(f"   Database:  {config.notion.database_name}")
-    print(f"   Last sync: {config.pocket.last_sync or 'Never'}")
-    print(f"   Config:    {CONFIG_FILE}")
+    lines.append(f"   Database:  {config.notion.database_name}")
+    lines.append(f"   Last sync: {config.pocket.last_sync or 'Never'}")
+    lines.append(f"   Config:    {CONFIG_FILE}")
 
     # Check API keys
-    pocket_key = os.getenv("POCKET_API_KEY")
-    notion_key = os.getenv("NOTION_API_KEY")
+    pocket_key = get_pocket_api_key()
+    notion_key = get_notion_api_key()
 
     if not pocket_key or not notion_key:
-        print()
+        lines.append("")
         if not pocket_key:
-            print_warning("POCKET_API_KEY not set")
+            lines.append(format_warning("POCKET_API_KEY not set"))
         if not notion_key:
-            print_warning("NOTION_API_KEY not set")
+            lines.append(format_warning("NOTION_API_KEY not set"))
+        print("\n".join(lines))
         return 0
 
+    print("\n".join(lines))
+
     # Try to get pending count
+    from .sync import get_engine
+
     print("\n   Checking for new recordings...", end=" ", flush=True)
     try:
-        pocket = PocketClient(pocket_key)
-        notion = NotionClient(notion_key)
-        engine = SyncEngine(pocket, notion, config)
-        pending = engine.get_pending_count()
+        engine = get_engine(config, pocket_key, notion_key)
+        pending = engine.get_pending_count(max_age=0) if fresh else engine.get_pending_count()
         print(f"\n\n📬 {pending} new recordings ready to sync")
     except Exception as e:
         print(f"\n\n⚠️  Could not check: {e}")
@@ -643,22 +666,25 @@ def cmd_config(action: str = "show") -> int:
     config = Config.load()
 
     if action == "show":
-        print("\n⚙️  Power-Flow Configuration\n")
+        lines = ["", "⚙️  Power-Flow Configuration", ""]
 
         if not config.is_configured:
-            print_warning("Not configured.")
-            print("   Run 'powerflow setup' to get started.")
+            lines.append(format_warning("Not configured."))
+            lines.append("   Run 'powerflow setup' to get started.")
+            print("\n".join(lines))
             return 0
 
-        print(f"   Database ID:   {config.notion.database_id}")
-        print(f"   Database Name: {config.notion.database_name}")
-        print(f"   Created:       {config.created_at}")
-        print(f"   Last Sync:     {config.pocket.last_sync or 'Never'}")
-        print("\n   Property Mapping:")
-        for pocket, notion in config.notion.property_map.items():
-            print(f"      {pocket} → {notion}")
-        print(f"\n   Config file: {CONFIG_FILE}")
-        print()
+        lines.append(f"   Database ID:   {config.notion.database_id}")
+        lines.append(f"   Database Name: {config.notion.database_name}")
+        lines.append(f"   Created:       {config.created_at}")
+        lines.append(f"   Last Sync:     {config.pocket.last_sync or 'Never'}")
+        lines.append("\n   Property Mapping:")
+        lines.extend(
+            f"      {pocket} → {notion}" for pocket, notion in config.notion.property_map.items()
+        )
+        lines.append(f"\n   Config file: {CONFIG_FILE}")
+        lines.append("")
+        print("\n".join(lines))
         return 0
 
     elif action == "reset":
@@ -675,6 +701,7 @@ def cmd_config(action: str = "show") -> int:
 
         if confirm == "y":
             CONFIG_FILE.unlink()
+            Config.invalidate_cache()
             print_success("Configuration reset.")
             print("   Run 'powerflow setup' to configure again.")
         else:
@@ -712,19 +739,24 @@ def cmd_daemon(args: list[str]) -> int:
 
     subcommand = args[0].lower()
 
-    # Parse --interval flag
+    # Parse --interval and --foreground flags in a single pass
     interval = daemon.DEFAULT_INTERVAL_MINUTES
-    for i, arg in enumerate(args):
-        if arg == "--interval" and i + 1 < len(args):
+    foreground = False
+    flags = iter(args[1:])
+    for arg in flags:
+        if arg in ("--foreground", "-f"):
+            foreground = True
+        elif arg == "--interval":
+            value = next(flags, None)
+            if value is None:
+                break
             try:
-                interval = daemon.parse_interval(args[i + 1])
+                interval = daemon.parse_interval(value)
             except ValueError:
-                print_error(f"Invalid interval: {args[i + 1]}")
+                print_error(f"Invalid interval: {value}")
                 print("   Examples: 5m, 15m, 30m, 1h")
                 return 1
 
-    foreground = "--foreground" in args or "-f" in args
-
     if subcommand == "start":
         return daemon.start_daemon(interval, foreground=foreground)
     elif subcommand == "stop":
@@ -745,6 +777,34 @@ def cmd_daemon(args: list[str]) -> int:
 # MAIN ENTRY POINT
 # =============================================================================
 
+def _cmd_help(args: list[str]) -> int:
+    """Print usage and exit successfully."""
+    print_usage()
+    return 0
+
+
+def _cmd_version(args: list[str]) -> int:
+    """Print the installed version."""
+    from . import __version__
+    print(f"powerflow {__version__}")
+    return 0
+
+
+# Command name -> handler taking the full argument list (command included)
+_COMMANDS: dict[str, Callable[[list[str]], int]] = {
+    "setup": lambda args: cmd_setup(),
+    "sync": lambda args: cmd_sync(dry_run="--dry-run" in args or "-n" in args),
+    "status": lambda args: cmd_status(fresh="--fresh" in args),
+    "config": lambda args: cmd_config(args[1] if len(args) > 1 else "show"),
+    "daemon": lambda args: cmd_daemon(args[1:]),
+    "--help": _cmd_help,
+    "-h": _cmd_help,
+    "help": _cmd_help,
+    "--version": _cmd_version,
+    "-v": _cmd_version,
+}
+
+
 def main(args: list[str] | None = None) -> int:
     """Main entry point."""
     if args is None:
@@ -755,31 +815,14 @@ def main(args: list[str] | None = None) -> int:
         return 0
 
     command = args[0].lower()
+    handler = _COMMANDS.get(command)
 
     try:
-        if command == "setup":
-            return cmd_setup()
-        elif command == "sync":
-            dry_run = "--dry-run" in args or "-n" in args
-            return cmd_sync(dry_run=dry_run)
-        elif command == "status":
-            return cmd_status()
-        elif command == "config":
-            action = args[1] if len(args) > 1 else "show"
-            return cmd_config(action)
-        elif command == "daemon":
-            return cmd_daemon(args[1:])
-        elif command in ["--help", "-h", "help"]:
-            print_usage()
-            return 0
-        elif command in ["--version", "-v"]:
-            from . import __version__
-            print(f"powerflow {__version__}")
-            return 0
-        else:
+        if handler is None:
             print_error(f"Unknown command: {command}")
             print_usage()
             return 1
+        return handler(args)
     except KeyboardInterrupt:
         print("\n\nInterrupted.")
         return 1
@@ -804,6 +847,7 @@ Usage:
   powerflow sync               Sync recordings to Notion
   powerflow sync --dry-run     Preview sync without making changes
   powerflow status             Show sync status and pending count
+  powerflow status --fresh     Re-check pending count, ignoring the cache
   powerflow config show        Show current configuration
   powerflow config reset       Reset all configuration
 
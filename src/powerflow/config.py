@@ -2,13 +2,36 @@
 
 import json
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from powerflow.utils.jsonio import json_dumps, json_loads
+
 CONFIG_DIR = Path.home() / ".powerflow"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# Parsed config file contents, keyed by (path, mtime_ns, size) so an unchanged
+# file is not re-read and re-parsed on every load (e.g. each daemon tick)
+_CONFIG_CACHE: tuple[tuple[str, int, int], dict] | None = None
+
+
+def _write_temp(directory: Path, payload: bytes) -> Path:
+    """Write payload to a new temporary file in directory and return its path.
+
+    The data is fsynced before returning, so renaming the file over the
+    config can't leave an empty file behind after a crash or power loss.
+    """
+    import tempfile  # Only needed when saving; keeps CLI startup light
+
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=directory, prefix=".config-", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(payload)
+        tmp.flush()
+        os.fsync(tmp.fileno())
+    return Path(tmp.name)
+
 
 @dataclass
 class NotionConfig:
@@ -25,6 +48,15 @@ class NotionConfig:
         "source_url": "Source",
     })
 
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict (cheaper than dataclasses.asdict)."""
+        return {
+            "database_id": self.database_id,
+            "database_name": self.database_name,
+            # Copied: save() caches this dict, so it must not alias live state
+            "property_map": dict(self.property_map),
+        }
+
 
 @dataclass
 class PocketConfig:
@@ -32,6 +64,10 @@ class PocketConfig:
 
     last_sync: str | None = None  # ISO timestamp
 
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict (cheaper than dataclasses.asdict)."""
+        return {"last_sync": self.last_sync}
+
 
 @dataclass
 class Config:
@@ -43,35 +79,84 @@ class Config:
 
     @classmethod
     def load(cls) -> "Config":
-        """Load config from file, or return defaults."""
-        if not CONFIG_FILE.exists():
+        """Load config from file, or return defaults.
+
+        Parsed file contents are cached until the file's mtime or size
+        changes. Each call still returns a fresh Config, safe to mutate.
+        """
+        global _CONFIG_CACHE
+
+        try:
+            stat = CONFIG_FILE.stat()
+        except FileNotFoundError:
             return cls()
 
+        cache_key = (str(CONFIG_FILE), stat.st_mtime_ns, stat.st_size)
+        if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == cache_key:
+            return cls._from_dict(_CONFIG_CACHE[1])
+
         try:
-            data = json.loads(CONFIG_FILE.read_text())
-            return cls(
-                notion=NotionConfig(**data.get("notion", {})),
-                pocket=PocketConfig(**data.get("pocket", {})),
-                created_at=data.get("created_at"),
-            )
+            data = json_loads(CONFIG_FILE.read_bytes())
+            config = cls._from_dict(data)
         except (json.JSONDecodeError, TypeError) as e:
             print(f"⚠️  Config file corrupted, using defaults: {e}")
             return cls()
 
+        _CONFIG_CACHE = (cache_key, data)
+        return config
+
+    @classmethod
+    def _from_dict(cls, data: dict) -> "Config":
+        """Build a Config from parsed JSON without sharing mutable state."""
+        notion_data = dict(data.get("notion", {}))
+        if isinstance(notion_data.get("property_map"), dict):
+            notion_data["property_map"] = dict(notion_data["property_map"])
+        return cls(
+            notion=NotionConfig(**notion_data),
+            pocket=PocketConfig(**data.get("pocket", {})),
+            created_at=data.get("created_at"),
+        )
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget cached file contents so the next load() re-reads the file."""
+        global _CONFIG_CACHE
+        _CONFIG_CACHE = None
+
     def save(self) -> None:
-        """Save config to file."""
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        """Save config to file.
+
+        Writes to a temporary file and renames it over the config, so readers
+        never see a partially written file.
+        """
+        global _CONFIG_CACHE
 
         if not self.created_at:
             self.created_at = datetime.now().isoformat()
 
         data = {
-            "notion": asdict(self.notion),
-            "pocket": asdict(self.pocket),
+            "notion": self.notion.to_dict(),
+            "pocket": self.pocket.to_dict(),
             "created_at": self.created_at,
         }
 
-        CONFIG_FILE.write_text(json.dumps(data, indent=2))
+        payload = json_dumps(data)
+        try:
+            tmp_path = _write_temp(CONFIG_FILE.parent, payload)
+        except FileNotFoundError:
+            # Only create the directory when it is missing (first save or reset)
+            CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _write_temp(CONFIG_FILE.parent, payload)
+
+        try:
+            os.replace(tmp_path, CONFIG_FILE)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Prime the load cache with what we just wrote, skipping the next parse
+        stat = CONFIG_FILE.stat()
+        _CONFIG_CACHE = ((str(CONFIG_FILE), stat.st_mtime_ns, stat.st_size), data)
 
     def update_last_sync(self) -> None:
         """Update last sync timestamp and save."""
@@ -84,21 +169,37 @@ class Config:
         return bool(self.notion.database_id)
 
 
+# Environment variables holding the API keys
+API_KEY_VARS = ("POCKET_API_KEY", "NOTION_API_KEY")
+
+# API keys read from the environment once per process; see refresh_env()
+_ENV_SNAPSHOT: dict[str, str | None] | None = None
+
+
+def _env() -> dict[str, str | None]:
+    """Return the cached API key snapshot, reading the environment on first use."""
+    global _ENV_SNAPSHOT
+    if _ENV_SNAPSHOT is None:
+        _ENV_SNAPSHOT = {var: os.environ.get(var) for var in API_KEY_VARS}
+    return _ENV_SNAPSHOT
+
+
+def refresh_env() -> None:
+    """Re-read API keys from the environment on next access."""
+    global _ENV_SNAPSHOT
+    _ENV_SNAPSHOT = None
+
+
 def get_pocket_api_key() -> str | None:
     """Get Pocket API key from environment."""
-    return os.getenv("POCKET_API_KEY")
+    return _env()["POCKET_API_KEY"]
 
 
 def get_notion_api_key() -> str | None:
     """Get Notion API key from environment."""
-    return os.getenv("NOTION_API_KEY")
+    return _env()["NOTION_API_KEY"]
 
 
 def validate_env() -> list[str]:
     """Validate required environment variables. Returns list of missing vars."""
-    missing = []
-    if not get_pocket_api_key():
-        missing.append("POCKET_API_KEY")
-    if not get_notion_api_key():
-        missing.append("NOTION_API_KEY")
-    return missing
+    return [var for var, value in _env().items() if not value]
@@ -9,29 +9,47 @@ Features:
 - launchd/systemd service installation
 """
 
+import atexit
 import json
 import logging
 import os
 import signal
+import subprocess
 import sys
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
-from .config import CONFIG_DIR, Config
-from .notion import NotionClient
-from .pocket import PocketClient
-from .sync import SyncEngine
+from .config import (
+    CONFIG_DIR,
+    Config,
+    get_notion_api_key,
+    get_pocket_api_key,
+    refresh_env,
+)
+from .utils.jsonio import json_dumps, json_loads
 
 # Daemon files
 PID_FILE = CONFIG_DIR / "daemon.pid"
 LOG_FILE = CONFIG_DIR / "daemon.log"
 STATE_FILE = CONFIG_DIR / "daemon_state.json"
 
+# Signals that stop the daemon
+SHUTDOWN_SIGNALS = {signal.SIGTERM, signal.SIGINT}
+
 # Default interval
 DEFAULT_INTERVAL_MINUTES = 15
 RETRY_DELAY_SECONDS = 60  # Retry failed syncs after 1 minute
 MAX_RETRIES = 2
+FAILURE_NOTIFY_INTERVAL_SECONDS = 3600  # Repeat "sync failed" at most hourly
+
+# Seconds to wait for the daemon to exit after SIGTERM before sending SIGKILL
+STOP_TIMEOUT_SECONDS = 5.0
+
+# Log records buffered before a forced write (the daemon also flushes per cycle)
+LOG_BUFFER_CAPACITY = 64
 
 
 def parse_interval(interval_str: str) -> int:
@@ -82,44 +100,79 @@ def setup_logging() -> logging.Logger:
     Uses RotatingFileHandler to prevent log files from growing indefinitely.
     - Max size: 10 MB per file
     - Keeps 3 backup files (daemon.log.1, daemon.log.2, daemon.log.3)
-    """
-    from logging.handlers import RotatingFileHandler
 
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    Records are buffered in a MemoryHandler and written in one burst when
+    the daemon calls flush_logs() after each sync cycle. Errors, a full
+    buffer, and shutdown flush immediately.
+    """
+    from logging.handlers import MemoryHandler, RotatingFileHandler
 
     logger = logging.getLogger("powerflow-daemon")
     logger.setLevel(logging.INFO)
 
+    # Already set up for this log file (e.g. a second daemon instance): reuse it
+    log_path = os.path.abspath(LOG_FILE)
+    for existing in logger.handlers:
+        target = getattr(existing, "target", existing)
+        if getattr(target, "baseFilename", None) == log_path:
+            return logger
+
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
     # Clear any existing handlers to avoid duplicates
-    logger.handlers.clear()
+    for old_handler in logger.handlers[:]:
+        old_target = getattr(old_handler, "target", None)
+        logger.removeHandler(old_handler)
+        old_handler.close()  # MemoryHandler flushes to its target here
+        if old_target is not None:
+            old_target.close()
 
     # Rotating file handler: 10MB max, keep 3 backups
-    handler = RotatingFileHandler(
+    file_handler = RotatingFileHandler(
         LOG_FILE,
         maxBytes=10 * 1024 * 1024,  # 10 MB
         backupCount=3,
         encoding="utf-8",
     )
-    handler.setFormatter(logging.Formatter(
+    file_handler.setFormatter(logging.Formatter(
         "%(asctime)s [%(levelname)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     ))
+
+    # Buffer in front of the file: one write burst per sync cycle
+    handler = MemoryHandler(
+        LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
     logger.addHandler(handler)
+    atexit.register(handler.flush)
 
     return logger
 
 
+def flush_logs(logger: logging.Logger) -> None:
+    """Write any buffered log records to disk."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
 def save_state(state: dict) -> None:
     """Save daemon state to file atomically.
 
     Uses write-to-temp-then-rename pattern to prevent corruption
     if the process is interrupted mid-write.
     """
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    payload = json_dumps(state, default=str)
     tmp_file = STATE_FILE.with_suffix(".tmp")
     try:
-        tmp_file.write_text(json.dumps(state, indent=2, default=str))
-        tmp_file.rename(STATE_FILE)  # Atomic on POSIX
+        try:
+            tmp_file.write_bytes(payload)
+        except FileNotFoundError:
+            # Config directory missing (first run or removed) - create and retry
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(payload)
+        os.replace(tmp_file, STATE_FILE)  # Atomic, also on Windows
     except OSError:
         # Clean up temp file if rename fails
         tmp_file.unlink(missing_ok=True)
@@ -130,7 +183,7 @@ def load_state() -> dict:
     """Load daemon state from file."""
     if STATE_FILE.exists():
         try:
-            return json.loads(STATE_FILE.read_text())
+            return json_loads(STATE_FILE.read_bytes())
         except (OSError, json.JSONDecodeError):
             pass
     return {}
@@ -140,18 +193,21 @@ def send_notification(title: str, message: str) -> None:
     """
     Send a desktop notification (macOS).
 
-    Fails silently on other platforms or if notification fails.
+    Fire-and-forget: osascript is started but not waited on, so the sync
+    loop never blocks on it. Fails silently on other platforms or if
+    notification fails.
     """
     if sys.platform != "darwin":
         return
 
     try:
-        import subprocess
         script = f'display notification "{message}" with title "{title}"'
-        subprocess.run(
+        # Finished children are reaped by subprocess on the next Popen call
+        subprocess.Popen(
             ["osascript", "-e", script],
-            capture_output=True,
-            timeout=5
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
     except Exception:
         pass  # Notifications are best-effort
@@ -178,10 +234,73 @@ def is_running() -> tuple[bool, int | None]:
         return False, None
 
 
-def write_pid() -> None:
-    """Write current PID to file."""
+def _write_pid_temp(pid: int) -> Path:
+    """Write pid to a temp file next to the PID file and return its path.
+
+    Named after the writing process, so concurrent writers never share one.
+    """
+    tmp_file = PID_FILE.with_name(f".{PID_FILE.name}.{os.getpid()}.tmp")
+    tmp_file.write_text(str(pid))
+    return tmp_file
+
+
+def claim_pid_file(pid: int | None = None) -> tuple[bool, int | None]:
+    """
+    Atomically create the PID file, unless a live daemon already holds it.
+
+    The PID is written to a temp file which is then hard-linked into place.
+    Linking fails if the PID file exists, so two concurrent starts cannot
+    both succeed, and readers never see the file before the PID is in it.
+    A PID file left by a dead process is removed and the claim retried once.
+
+    Args:
+        pid: PID to record (defaults to the current process)
+
+    Returns:
+        (claimed, pid) - the PID now in the file, or the running daemon's PID
+    """
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    PID_FILE.write_text(str(os.getpid()))
+    pid = pid or os.getpid()
+    tmp_file = _write_pid_temp(pid)
+
+    try:
+        for _ in range(2):
+            try:
+                os.link(tmp_file, PID_FILE)
+            except FileExistsError:
+                try:
+                    existing = int(PID_FILE.read_text().strip())
+                    os.kill(existing, 0)
+                except (ValueError, ProcessLookupError):
+                    # Stale or unreadable PID file - remove it and try again
+                    PID_FILE.unlink(missing_ok=True)
+                    continue
+                except PermissionError:
+                    pass  # Process exists but belongs to another user
+                except FileNotFoundError:
+                    continue  # Removed between our link and read
+                return False, existing
+            else:
+                return True, pid
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+    return False, None
+
+
+def write_pid(pid: int | None = None) -> None:
+    """Write a PID (default: the current process) to the PID file.
+
+    Replaces the file atomically, so a concurrent is_running() never reads
+    it empty and removes it as stale.
+    """
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = _write_pid_temp(pid or os.getpid())
+    try:
+        os.replace(tmp_file, PID_FILE)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
 
 
 def remove_pid() -> None:
@@ -196,15 +315,60 @@ class PowerFlowDaemon:
         self.interval_minutes = interval_minutes
         self.running = False
         self.logger = setup_logging()
-
-        # Set up signal handlers
-        signal.signal(signal.SIGTERM, self._handle_shutdown)
-        signal.signal(signal.SIGINT, self._handle_shutdown)
-
-    def _handle_shutdown(self, signum: int, frame) -> None:  # frame type is complex, leave as Any
-        """Handle shutdown signal gracefully."""
+        # Set on shutdown so the wait between syncs returns immediately
+        self._shutdown_event = threading.Event()
+        # monotonic() time of the last failure notification, None while healthy
+        self._failure_notified_at: float | None = None
+
+    def _watch_signals(self) -> set[int] | None:
+        """Route shutdown signals to a dedicated thread.
+
+        The signals are blocked on the main thread and collected with
+        sigwait(), so a signal can never interrupt the loop mid-sync or
+        mid-way through writing state. Returns the previous signal mask,
+        or None on platforms without pthread_sigmask (where plain handlers
+        are installed instead).
+        """
+        if not hasattr(signal, "pthread_sigmask"):
+            for signum in SHUTDOWN_SIGNALS:
+                signal.signal(signum, lambda signum, frame: self._request_shutdown(signum))
+            return None
+
+        # Block before starting the thread so it inherits the mask sigwait needs
+        previous = signal.pthread_sigmask(signal.SIG_BLOCK, SHUTDOWN_SIGNALS)
+        threading.Thread(target=self._sigwait_loop, name="powerflow-signals", daemon=True).start()
+        return previous
+
+    def _sigwait_loop(self) -> None:
+        """Block until a shutdown signal arrives, then stop the daemon."""
+        self._request_shutdown(signal.sigwait(SHUTDOWN_SIGNALS))
+
+    def _request_shutdown(self, signum: int) -> None:
+        """Stop the main loop after the current sync finishes."""
         self.logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        self._shutdown_event.set()
+
+    def _notify_failure(self) -> None:
+        """Notify about persistent sync failure, at most once per interval."""
+        now = time.monotonic()
+        if (
+            self._failure_notified_at is not None
+            and now - self._failure_notified_at < FAILURE_NOTIFY_INTERVAL_SECONDS
+        ):
+            return
+        self._failure_notified_at = now
+        send_notification(
+            "Power-Flow Sync Failed",
+            f"Check logs: {LOG_FILE}"
+        )
+
+    def _notify_recovered(self) -> None:
+        """Notify that syncing works again, if a failure was reported."""
+        if self._failure_notified_at is None:
+            return
+        self._failure_notified_at = None
+        send_notification("Power-Flow Recovered", "Sync is working again")
 
     def _do_sync(self) -> dict:
         """
@@ -213,8 +377,8 @@ class PowerFlowDaemon:
         Returns:
             Result dict with created, skipped, failed counts
         """
-        pocket_key = os.getenv("POCKET_API_KEY")
-        notion_key = os.getenv("NOTION_API_KEY")
+        pocket_key = get_pocket_api_key()
+        notion_key = get_notion_api_key()
 
         if not pocket_key or not notion_key:
             return {"error": "API keys not set"}
@@ -223,10 +387,12 @@ class PowerFlowDaemon:
         if not config.is_configured:
             return {"error": "Not configured"}
 
+        # Imported here so `daemon status`/`stop`/`install` don't load the HTTP stack
+        from .sync import get_engine
+
         try:
-            pocket = PocketClient(pocket_key)
-            notion = NotionClient(notion_key)
-            engine = SyncEngine(pocket, notion, config)
+            # Reuses the same clients each tick, keeping connections alive
+            engine = get_engine(config, pocket_key, notion_key)
 
             result = engine.sync()
 
@@ -244,28 +410,34 @@ class PowerFlowDaemon:
         """Main daemon loop."""
         write_pid()
         self.running = True
+        previous_mask = self._watch_signals()
 
-        self.logger.info(f"Daemon started (PID: {os.getpid()}, interval: {self.interval_minutes}m)")
-
-        # Update state
-        save_state({
-            "status": "running",
-            "pid": os.getpid(),
-            "interval_minutes": self.interval_minutes,
-            "started_at": datetime.now().isoformat(),
-            "last_sync": None,
-            "last_result": None,
-        })
+        # Everything after blocking the signals runs under the finally below,
+        # so the PID file and signal mask are always cleaned up
+        try:
+            self.logger.info(
+                f"Daemon started (PID: {os.getpid()}, interval: {self.interval_minutes}m)"
+            )
+
+            # Update state (kept in memory; this process is the only writer)
+            state = {
+                "status": "running",
+                "pid": os.getpid(),
+                "interval_minutes": self.interval_minutes,
+                "started_at": datetime.now().isoformat(),
+                "last_sync": None,
+                "last_result": None,
+            }
+            save_state(state)
 
-        # Send startup notification
-        send_notification(
-            "Power-Flow Started",
-            f"Syncing every {self.interval_minutes} minutes"
-        )
+            # Send startup notification
+            send_notification(
+                "Power-Flow Started",
+                f"Syncing every {self.interval_minutes} minutes"
+            )
 
-        consecutive_failures = 0
+            consecutive_failures = 0
 
-        try:
             while self.running:
                 # Perform sync with retry logic
                 self.logger.info("Starting sync...")
@@ -289,13 +461,11 @@ class PowerFlowDaemon:
                     else:
                         self.logger.warning("Max retries reached, waiting for next interval")
                         wait_seconds = self.interval_minutes * 60
-                        # Notify on persistent failure
-                        send_notification(
-                            "Power-Flow Sync Failed",
-                            f"Check logs: {LOG_FILE}"
-                        )
+                        # Notify on persistent failure (rate-limited)
+                        self._notify_failure()
                 else:
                     consecutive_failures = 0  # Reset on success
+                    self._notify_recovered()
                     pending = result.get('pending', 0)
                     pending_str = f", pending={pending}" if pending > 0 else ""
                     self.logger.info(
@@ -316,27 +486,32 @@ class PowerFlowDaemon:
                     wait_seconds = self.interval_minutes * 60
 
                 # Update state
-                state = load_state()
                 state["last_sync"] = datetime.now().isoformat()
                 state["last_result"] = result
                 state["consecutive_failures"] = consecutive_failures
                 state["next_sync"] = (datetime.now() + timedelta(seconds=wait_seconds)).isoformat()
                 save_state(state)
 
-                # Wait for next interval (check every 10s for shutdown signal)
-                waited = 0
-                while waited < wait_seconds and self.running:
-                    time.sleep(min(10, wait_seconds - waited))
-                    waited += 10
+                # Write this cycle's log lines before going idle
+                flush_logs(self.logger)
+
+                # Wait for next interval, waking early on a shutdown signal
+                if self.running:
+                    self._shutdown_event.wait(timeout=wait_seconds)
 
         finally:
             # Cleanup
-            remove_pid()
-            save_state({
-                "status": "stopped",
-                "stopped_at": datetime.now().isoformat(),
-            })
-            self.logger.info("Daemon stopped")
+            try:
+                remove_pid()
+                save_state({
+                    "status": "stopped",
+                    "stopped_at": datetime.now().isoformat(),
+                })
+                self.logger.info("Daemon stopped")
+                flush_logs(self.logger)
+            finally:
+                if previous_mask is not None:
+                    signal.pthread_sigmask(signal.SIG_SETMASK, previous_mask)
 
 
 def start_daemon(interval_minutes: int = DEFAULT_INTERVAL_MINUTES, foreground: bool = False) -> int:
@@ -350,9 +525,13 @@ def start_daemon(interval_minutes: int = DEFAULT_INTERVAL_MINUTES, foreground: b
     Returns:
         Exit code (0 = success)
     """
-    running, pid = is_running()
-    if running:
-        print(f"❌ Daemon already running (PID: {pid})")
+    # Claim the PID file up front so concurrent starts cannot both proceed
+    claimed, pid = claim_pid_file()
+    if not claimed:
+        if pid:
+            print(f"❌ Daemon already running (PID: {pid})")
+        else:
+            print(f"❌ Could not create PID file: {PID_FILE}")
         print("   Use 'powerflow daemon stop' first")
         return 1
 
@@ -368,12 +547,14 @@ def start_daemon(interval_minutes: int = DEFAULT_INTERVAL_MINUTES, foreground: b
     try:
         pid = os.fork()
         if pid > 0:
-            # Parent process
+            # Parent process - hand the PID file over to the child
+            write_pid(pid)
             print(f"✅ Daemon started (PID: {pid}, interval: {interval_minutes}m)")
             print(f"   Logs: {LOG_FILE}")
             print("   Use 'powerflow daemon status' to check")
             return 0
     except OSError as e:
+        remove_pid()
         print(f"❌ Failed to fork: {e}")
         return 1
 
@@ -395,6 +576,61 @@ def start_daemon(interval_minutes: int = DEFAULT_INTERVAL_MINUTES, foreground: b
     return 0
 
 
+def wait_for_exit(pid: int, timeout: float) -> bool:
+    """
+    Block until process pid exits or timeout seconds pass.
+
+    Uses an exit notification from the kernel where available (pidfd on
+    Linux, kqueue on macOS/BSD), otherwise polls.
+
+    Returns:
+        True if the process is gone
+    """
+    import select
+
+    if hasattr(os, "pidfd_open"):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass  # Kernel without pidfd support
+        else:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                return bool(poller.poll(timeout * 1000))
+            finally:
+                os.close(fd)
+
+    if hasattr(select, "kqueue"):
+        # kqueue only exists on macOS/BSD; Any keeps other platforms' type checks clean
+        bsd_select: Any = select
+        kq = bsd_select.kqueue()
+        try:
+            event = bsd_select.kevent(
+                pid,
+                filter=bsd_select.KQ_FILTER_PROC,
+                flags=bsd_select.KQ_EV_ADD | bsd_select.KQ_EV_ONESHOT,
+                fflags=bsd_select.KQ_NOTE_EXIT,
+            )
+            return bool(kq.control([event], 1, timeout))
+        except ProcessLookupError:
+            return True
+        finally:
+            kq.close()
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
 def stop_daemon() -> int:
     """
     Stop the daemon.
@@ -403,7 +639,7 @@ def stop_daemon() -> int:
         Exit code (0 = success)
     """
     running, pid = is_running()
-    if not running:
+    if not running or pid is None:
         print("ℹ️  Daemon is not running")
         return 0
 
@@ -412,15 +648,14 @@ def stop_daemon() -> int:
         print(f"✅ Sent stop signal to daemon (PID: {pid})")
 
         # Wait for it to stop
-        for _ in range(10):
-            time.sleep(0.5)
-            if not is_running()[0]:
-                print("   Daemon stopped")
-                return 0
+        if wait_for_exit(pid, STOP_TIMEOUT_SECONDS):
+            is_running()  # Clears the PID file if the daemon left it behind
+            print("   Daemon stopped")
+            return 0
 
         print("⚠️  Daemon still running, sending SIGKILL...")
         os.kill(pid, signal.SIGKILL)
-        time.sleep(0.5)
+        wait_for_exit(pid, 0.5)
         remove_pid()
         print("   Daemon killed")
         return 0
@@ -480,50 +715,29 @@ def daemon_status() -> int:
 def generate_launchd_plist(interval_minutes: int = DEFAULT_INTERVAL_MINUTES) -> str:
     """Generate macOS launchd plist content."""
     # Get the powerflow executable path
+    import plistlib
     import shutil
     powerflow_path = shutil.which("powerflow") or "/usr/local/bin/powerflow"
 
     # Get API keys from environment (launchd doesn't inherit shell env)
-    POCKET_API_KEY = os.getenv("POCKET_API_KEY", "")
-    NOTION_API_KEY = os.getenv("NOTION_API_KEY", "")
-
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.powerflow.sync</string>
-
-    <key>ProgramArguments</key>
-    <array>
-        <string>{powerflow_path}</string>
-        <string>sync</string>
-    </array>
-
-    <key>StartInterval</key>
-    <integer>{interval_minutes * 60}</integer>
-
-    <key>RunAtLoad</key>
-    <true/>
-
-    <key>StandardOutPath</key>
-    <string>{LOG_FILE}</string>
-
-    <key>StandardErrorPath</key>
-    <string>{LOG_FILE}</string>
-
-    <key>EnvironmentVariables</key>
-    <dict>
-        <key>PATH</key>
-        <string>/usr/local/bin:/usr/bin:/bin</string>
-        <key>POCKET_API_KEY</key>
-        <string>{POCKET_API_KEY}</string>
-        <key>NOTION_API_KEY</key>
-        <string>{NOTION_API_KEY}</string>
-    </dict>
-</dict>
-</plist>
-"""
+    POCKET_API_KEY = get_pocket_api_key() or ""
+    NOTION_API_KEY = get_notion_api_key() or ""
+
+    # plistlib escapes values, so keys containing <, & or " stay valid XML
+    plist = {
+        "Label": "com.powerflow.sync",
+        "ProgramArguments": [powerflow_path, "sync"],
+        "StartInterval": interval_minutes * 60,
+        "RunAtLoad": True,
+        "StandardOutPath": str(LOG_FILE),
+        "StandardErrorPath": str(LOG_FILE),
+        "EnvironmentVariables": {
+            "PATH": "/usr/local/bin:/usr/bin:/bin",
+            "POCKET_API_KEY": POCKET_API_KEY,
+            "NOTION_API_KEY": NOTION_API_KEY,
+        },
+    }
+    return plistlib.dumps(plist, sort_keys=False).decode()
 
 
 def install_service(interval_minutes: int = DEFAULT_INTERVAL_MINUTES) -> int:
@@ -551,8 +765,9 @@ def install_service(interval_minutes: int = DEFAULT_INTERVAL_MINUTES) -> int:
             print()
             return 1
 
-    # Check for API keys
-    if not os.getenv("POCKET_API_KEY") or not os.getenv("NOTION_API_KEY"):
+    # Check for API keys (re-read: they get baked into the plist)
+    refresh_env()
+    if not get_pocket_api_key() or not get_notion_api_key():
         print("⚠️  API keys not found in environment")
         print("   The service needs API keys. Add them to your shell profile:")
         print()
@@ -575,7 +790,6 @@ def install_service(interval_minutes: int = DEFAULT_INTERVAL_MINUTES) -> int:
     print(f"✅ Created {plist_path}")
 
     # Load the service
-    import subprocess
     try:
         subprocess.run(["launchctl", "unload", str(plist_path)],
                       capture_output=True)  # Ignore errors if not loaded
@@ -610,7 +824,6 @@ def uninstall_service() -> int:
         print("ℹ️  Service not installed")
         return 0
 
-    import subprocess
     try:
         subprocess.run(["launchctl", "unload", str(plist_path)], check=True)
         plist_path.unlink()
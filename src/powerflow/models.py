@@ -1,7 +1,24 @@
 """Data models for Power-Flow."""
 
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property, lru_cache
+from typing import Any
+
+from .blocks import (
+    create_bullet,
+    create_divider,
+    create_heading,
+    create_paragraph,
+    create_todo,
+    create_toggle,
+    format_duration,
+    iter_markdown_blocks,
+)
 
 # Constants
 TRANSCRIPT_PREVIEW_LENGTH = 500  # Characters to show in transcript preview
@@ -21,8 +38,78 @@ TAG_EMOJI_MAP = {
 }
 DEFAULT_EMOJI = "🎙️"
 
+# English month abbreviations, indexed by month number (what %b gives in the C locale)
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
-@dataclass
+
+def _format_month_day(dt: datetime) -> str:
+    """Format a date as e.g. 'Mar 05', same as strftime('%b %d') but faster."""
+    return f"{_MONTH_ABBR[dt.month]} {dt.day:02d}"
+
+
+@lru_cache(maxsize=8)
+def _compile_property_builder(
+    property_map_items: tuple[tuple[str, str], ...],
+) -> Callable[[Recording], dict]:
+    """Resolve a property map once and return a builder for page properties.
+
+    The property map is the same for every recording in a sync, so the
+    name lookups are hoisted out of the per-recording path.
+    """
+    property_map = dict(property_map_items)
+    title_prop = property_map.get("title", "Name")
+    pocket_id_prop = property_map.get("pocket_id", "Inbox ID")
+    source_prop = property_map.get("source_url")
+    tags_prop = property_map.get("tags")
+
+    def build(recording: Recording) -> dict:
+        # Title is always required; Pocket ID for deduplication (CRITICAL)
+        props: dict[str, dict[str, Any]] = {
+            title_prop: {"title": [{"text": {"content": recording.display_title}}]},
+            pocket_id_prop: {"rich_text": [{"text": {"content": recording.pocket_id}}]},
+        }
+
+        # Source URL
+        if source_prop is not None and recording.pocket_url:
+            props[source_prop] = {"url": recording.pocket_url}
+
+        # Tags (multi-select)
+        if tags_prop is not None and recording.tags:
+            seen = set()
+            unique_tags = []
+            for tag in recording.tags:
+                # One strip feeds both the display name and the dedup key
+                stripped = tag.strip()
+                if not stripped:
+                    continue
+                normalized = stripped.lower()
+                if normalized not in seen:
+                    seen.add(normalized)
+                    unique_tags.append({"name": stripped})
+            if unique_tags:
+                props[tags_prop] = {"multi_select": unique_tags}
+
+        return props
+
+    return build
+
+
+def property_builder(property_map: dict) -> Callable[[Recording], dict]:
+    """Return the page-properties builder for a property map.
+
+    Resolve it once before a batch and call it per recording, instead of
+    going through Recording.to_notion_properties each time.
+    """
+    items = tuple(property_map.items())
+    try:
+        return _compile_property_builder(items)
+    except TypeError:
+        # Unhashable values can't be cached; resolve them for this call only
+        return _compile_property_builder.__wrapped__(items)
+
+
+@dataclass(slots=True)
 class ActionItem:
     """An action item extracted from a recording."""
 
@@ -35,12 +122,11 @@ class ActionItem:
 
     def to_checklist_text(self) -> str:
         """Format as a checklist-style text line."""
-        parts = [f"☐ {self.label}"]
-        if self.priority:
-            parts.append(f" [{self.priority}]")
-        if self.due_date:
-            parts.append(f" (due: {self.due_date.strftime('%b %d')})")
-        return "".join(parts)
+        if not (self.priority or self.due_date):
+            return f"☐ {self.label}"
+        priority = f" [{self.priority}]" if self.priority else ""
+        due = f" (due: {_format_month_day(self.due_date)})" if self.due_date else ""
+        return f"☐ {self.label}{priority}{due}"
 
 
 @dataclass
@@ -80,19 +166,23 @@ class Recording:
 
         return has_summary or has_actions or has_mind_map
 
-    @property
+    # pocket_id and display_title are computed once per instance. Recordings
+    # are built whole by PocketClient and not mutated afterwards.
+    @cached_property
     def pocket_id(self) -> str:
         """Unique ID for deduplication."""
         return f"pocket:recording:{self.id}"
 
-    @property
+    @cached_property
     def display_title(self) -> str:
         """Best title for display."""
-        if self.title and self.title.strip():
-            return self.title.strip()
+        title = self.title.strip() if self.title else ""
+        if title:
+            return title
         if self.summary:
-            # First sentence or first 60 chars
-            first_line = self.summary.split('.')[0].strip()
+            # First sentence or first 60 chars (slice up to the first '.', no split list)
+            end = self.summary.find('.')
+            first_line = (self.summary if end < 0 else self.summary[:end]).strip()
             if len(first_line) > 60:
                 return first_line[:57] + "..."
             return first_line
@@ -103,41 +193,16 @@ class Recording:
 
         Returns first matching tag emoji, or default mic emoji.
         """
+        # One dict probe per tag; the first matching tag wins
         for tag in self.tags:
-            normalized = tag.strip().lower()
-            if normalized in TAG_EMOJI_MAP:
-                return {"type": "emoji", "emoji": TAG_EMOJI_MAP[normalized]}
+            emoji = TAG_EMOJI_MAP.get(tag.strip().lower())
+            if emoji:
+                return {"type": "emoji", "emoji": emoji}
         return {"type": "emoji", "emoji": DEFAULT_EMOJI}
 
     def to_notion_properties(self, property_map: dict) -> dict:
         """Convert to Notion page properties based on mapping."""
-        props = {}
-
-        # Title is always required
-        title_prop = property_map.get("title", "Name")
-        props[title_prop] = {"title": [{"text": {"content": self.display_title}}]}
-
-        # Pocket ID for deduplication (CRITICAL)
-        pocket_id_prop = property_map.get("pocket_id", "Inbox ID")
-        props[pocket_id_prop] = {"rich_text": [{"text": {"content": self.pocket_id}}]}
-
-        # Source URL
-        if self.pocket_url and "source_url" in property_map:
-            props[property_map["source_url"]] = {"url": self.pocket_url}
-
-        # Tags (multi-select)
-        if self.tags and "tags" in property_map:
-            seen = set()
-            unique_tags = []
-            for tag in self.tags:
-                normalized = tag.strip().lower()
-                if normalized and normalized not in seen:
-                    seen.add(normalized)
-                    unique_tags.append({"name": tag.strip()})
-            if unique_tags:
-                props[property_map["tags"]] = {"multi_select": unique_tags}
-
-        return props
+        return property_builder(property_map)(self)
 
     def _build_mind_map_tree(self) -> list[dict]:
         """Build mind map blocks with visual hierarchy.
@@ -149,7 +214,7 @@ class Recording:
             return []
 
         # Build parent-child relationships
-        children_map = {}  # parent_id -> [child_nodes]
+        children_map: defaultdict[str | None, list[dict]] = defaultdict(list)
         roots = []
 
         for node in self.mind_map:
@@ -161,47 +226,38 @@ class Recording:
             if node_id == parent_id:
                 roots.append(node)
             else:
-                if parent_id not in children_map:
-                    children_map[parent_id] = []
                 children_map[parent_id].append(node)
 
         blocks = []
+        emitted: set[int] = set()  # id() of nodes already output; guards against cycles
 
-        def add_node(node: dict, depth: int = 0):
-            """Add a node with visual depth indicator."""
+        # Depth-first with an explicit stack (reversed so siblings keep their order)
+        stack = [(root, 0) for root in reversed(roots)]
+        while stack:
+            node, depth = stack.pop()
+            if id(node) in emitted:
+                continue
+            emitted.add(id(node))
             title = node.get("title", "Untitled")
-            node_id = node.get("node_id")
 
             # Visual hierarchy: root is bold, children get indent markers
             if depth == 0:
-                # Root node - bold
-                blocks.append({
-                    "type": "bulleted_list_item",
-                    "bulleted_list_item": {
-                        "rich_text": [{
-                            "type": "text",
-                            "text": {"content": title},
-                            "annotations": {"bold": True}
-                        }]
-                    }
-                })
+                rich_text = {
+                    "type": "text",
+                    "text": {"content": title},
+                    "annotations": {"bold": True},
+                }
             else:
-                # Child nodes - indented with arrows
-                indent = "    " * (depth - 1)
-                prefix = f"{indent}↳ " if depth > 0 else ""
-                blocks.append({
-                    "type": "bulleted_list_item",
-                    "bulleted_list_item": {
-                        "rich_text": [{"type": "text", "text": {"content": f"{prefix}{title}"}}]
-                    }
-                })
-
-            # Process children
-            for child in children_map.get(node_id, []):
-                add_node(child, depth + 1)
-
-        for root in roots:
-            add_node(root, 0)
+                prefix = "    " * (depth - 1) + "↳ "
+                rich_text = {"type": "text", "text": {"content": f"{prefix}{title}"}}
+            blocks.append({
+                "type": "bulleted_list_item",
+                "bulleted_list_item": {"rich_text": [rich_text]},
+            })
+
+            children = children_map.get(node.get("node_id"))
+            if children:
+                stack.extend((child, depth + 1) for child in reversed(children))
 
         return blocks
 
@@ -217,41 +273,24 @@ class Recording:
            - Duration, capture date, Pocket link
            - Transcript toggle (nested, collapsed)
         """
-        from .blocks import (
-            create_bullet,
-            create_divider,
-            create_heading,
-            create_paragraph,
-            create_todo,
-            create_toggle,
-            format_duration,
-            parse_markdown_to_blocks,
-        )
-
         children = []
 
-        # 1. Summary — parsed from markdown into proper Notion blocks
+        # 1. Summary — parsed from markdown into proper Notion blocks,
+        # streamed straight into children without an intermediate list
         if self.summary:
-            summary_blocks = parse_markdown_to_blocks(self.summary)
-            if summary_blocks:
-                children.extend(summary_blocks)
+            children.extend(iter_markdown_blocks(self.summary))
 
         # 2. Action items section — visually prominent
         if self.action_items:
-            # Build to-do items first
-            todo_blocks = []
+            # Heading followed by one to-do per action item
+            children.append(create_heading("Action Items", level=3))
             for item in self.action_items:
                 todo_text = item.label
                 if item.priority:
                     todo_text += f" [{item.priority}]"
                 if item.due_date:
-                    todo_text += f" — due {item.due_date.strftime('%b %d')}"
-                todo_blocks.append(create_todo(todo_text))
-
-            # Wrap in a callout for visual prominence
-            # Use toggle-style callout: heading + nested items
-            children.append(create_heading("Action Items", level=3))
-            children.extend(todo_blocks)
+                    todo_text += f" — due {_format_month_day(item.due_date)}"
+                children.append(create_todo(todo_text))
 
         # 3. Mind map outline (if available) — hierarchical breakdown
         if self.mind_map:
@@ -284,10 +323,12 @@ class Recording:
 
         # Transcript toggle (nested, collapsed)
         if self.transcript:
-            # Show first N chars as preview
-            transcript_preview = self.transcript[:TRANSCRIPT_PREVIEW_LENGTH]
-            if len(self.transcript) > TRANSCRIPT_PREVIEW_LENGTH:
-                transcript_preview += "..."
+            # Show first N chars as preview; short transcripts are used as-is
+            transcript = self.transcript
+            transcript_preview = (
+                transcript if len(transcript) <= TRANSCRIPT_PREVIEW_LENGTH
+                else transcript[:TRANSCRIPT_PREVIEW_LENGTH] + "..."
+            )
             source_children.append(
                 create_toggle("📝 Full Transcript", [
                     create_paragraph(transcript_preview)
@@ -301,7 +342,7 @@ class Recording:
         return children
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of a sync operation."""
 
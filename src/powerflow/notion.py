@@ -9,17 +9,22 @@ Includes:
 
 from __future__ import annotations
 
+import json
+import logging
 import time
 
 import requests
 
+from powerflow.utils.jsonio import json_dumps, json_loads
 from powerflow.utils.logging import get_logger, log_api_call
 from powerflow.utils.reliability import (
     DEFAULT_TIMEOUT,
+    OVERLOAD_STATUS_CODES,
     RetryConfig,
     calculate_backoff,
     get_notion_limiter,
     is_retriable_error,
+    parse_retry_after,
 )
 
 logger = get_logger(__name__)
@@ -27,6 +32,13 @@ logger = get_logger(__name__)
 BASE_URL = "https://api.notion.com/v1"
 NOTION_VERSION = "2022-06-28"
 
+# Requests in flight at once for independent queries; the shared rate
+# limiter still caps the overall rate at Notion's 3 req/sec
+MAX_CONCURRENT_REQUESTS = 3
+
+# Seconds a fetched database schema is reused before GET /databases is repeated
+SCHEMA_CACHE_TTL = 60.0
+
 # Retry configuration for Notion API
 NOTION_RETRY_CONFIG = RetryConfig(
     max_attempts=3,
@@ -37,6 +49,31 @@ NOTION_RETRY_CONFIG = RetryConfig(
 )
 
 
+# Schema configs for new database properties, by property type. Shared by
+# reference in request payloads, which are only serialized - never mutate.
+_PROPERTY_CONFIGS: dict[str, dict] = {
+    "rich_text": {"rich_text": {}},
+    "url": {"url": {}},
+    "select": {"select": {"options": []}},
+    "date": {"date": {}},
+    "checkbox": {"checkbox": {}},
+    "multi_select": {"multi_select": {"options": []}},
+}
+
+
+def _property_config(property_name: str, property_type: str) -> dict:
+    """Return the schema config for a new database property of the given type."""
+    config = _PROPERTY_CONFIGS.get(property_type)
+    if config is not None:
+        return config
+    logger.warning(
+        "Unknown property type '%s' for '%s', defaulting to rich_text",
+        property_type,
+        property_name,
+    )
+    return _PROPERTY_CONFIGS["rich_text"]
+
+
 class NotionClient:
     """Client for Notion API with reliability features."""
 
@@ -56,6 +93,8 @@ class NotionClient:
             "Notion-Version": NOTION_VERSION,
         })
         self._rate_limiter = get_notion_limiter()
+        # database_id -> (monotonic timestamp, properties schema)
+        self._schema_cache: dict[str, tuple[float, dict[str, dict]]] = {}
         logger.debug("NotionClient initialized")
 
     def _request(self, method: str, endpoint: str, **kwargs) -> dict:
@@ -79,16 +118,21 @@ class NotionClient:
         if "timeout" not in kwargs:
             kwargs["timeout"] = DEFAULT_TIMEOUT.as_tuple
 
+        # Encode the body once (orjson when installed) rather than letting
+        # requests re-serialize it with the stdlib on every retry
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps(kwargs.pop("json"), indent=False)
+
         last_error: Exception | None = None
 
         for attempt in range(1, NOTION_RETRY_CONFIG.max_attempts + 1):
             # Rate limiting: wait for token
             self._rate_limiter.wait()
 
-            start_time = time.monotonic()
+            start_ns = time.perf_counter_ns()
             try:
                 response = self.session.request(method, url, **kwargs)
-                duration_ms = (time.monotonic() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
                 log_api_call(
                     logger,
@@ -99,20 +143,34 @@ class NotionClient:
                 )
 
                 response.raise_for_status()
-                return response.json()
+                self._rate_limiter.recover()
+                try:
+                    return json_loads(response.content)
+                except json.JSONDecodeError as e:
+                    # Surface as requests' own error, like response.json() did
+                    raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
 
-            except requests.exceptions.HTTPError as e:
+            except requests.exceptions.RequestException as e:
                 last_error = e
-                duration_ms = (time.monotonic() - start_time) * 1000
+                error_response = (
+                    e.response if isinstance(e, requests.exceptions.HTTPError) else None
+                )
+                status_code = error_response.status_code if error_response is not None else None
+
+                # Back off the shared request rate while the API is overloaded
+                if status_code in OVERLOAD_STATUS_CODES:
+                    self._rate_limiter.throttle()
 
                 # Check for rate limit with Retry-After header
-                if e.response is not None and e.response.status_code == 429:
-                    retry_after = e.response.headers.get("Retry-After")
-                    if retry_after:
-                        delay = float(retry_after)
+                if error_response is not None and status_code == 429:
+                    delay = parse_retry_after(
+                        error_response.headers.get("Retry-After"),
+                        NOTION_RETRY_CONFIG.max_delay,
+                    )
+                    if delay is not None:
                         logger.warning(
-                            "Rate limited, waiting %s seconds (Retry-After header)",
-                            retry_after,
+                            "Rate limited, waiting %.1f seconds (Retry-After header)",
+                            delay,
                         )
                         time.sleep(delay)
                         continue
@@ -137,30 +195,6 @@ class NotionClient:
                 )
                 time.sleep(delay)
 
-            except requests.exceptions.RequestException as e:
-                last_error = e
-                duration_ms = (time.monotonic() - start_time) * 1000
-
-                if not is_retriable_error(e, NOTION_RETRY_CONFIG):
-                    log_api_call(logger, method, url, error=str(e))
-                    raise
-
-                if attempt >= NOTION_RETRY_CONFIG.max_attempts:
-                    log_api_call(logger, method, url, error=f"Max retries exceeded: {e}")
-                    raise
-
-                delay = calculate_backoff(attempt, NOTION_RETRY_CONFIG)
-                logger.warning(
-                    "Retry %d/%d for %s %s in %.1fs: %s",
-                    attempt,
-                    NOTION_RETRY_CONFIG.max_attempts,
-                    method,
-                    endpoint,
-                    delay,
-                    e,
-                )
-                time.sleep(delay)
-
         # Should not reach here
         if last_error:
             raise last_error
@@ -193,9 +227,19 @@ class NotionClient:
         return self._request("GET", f"/databases/{database_id}")
 
     def get_database_schema(self, database_id: str) -> dict[str, dict]:
-        """Get database property schema."""
+        """Get database property schema.
+
+        Cached per database for SCHEMA_CACHE_TTL seconds; property changes
+        made through this client refresh the cache. Treat as read-only.
+        """
+        cached = self._schema_cache.get(database_id)
+        if cached is not None and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL:
+            return cached[1]
+
         db = self.get_database(database_id)
-        return db.get("properties", {})
+        schema = db.get("properties", {})
+        self._schema_cache[database_id] = (time.monotonic(), schema)
+        return schema
 
     def query_database(
         self,
@@ -204,7 +248,8 @@ class NotionClient:
         page_size: int = 100,
     ) -> list[dict]:
         """Query database pages with pagination."""
-        logger.debug("Querying database %s", database_id[:8])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Querying database %s", database_id[:8])
         results = []
         has_more = True
         start_cursor = None
@@ -235,8 +280,14 @@ class NotionClient:
             "property": pocket_id_property,
             "rich_text": {"equals": pocket_id},
         }
-        results = self.query_database(database_id, filter_obj, page_size=1)
-        return len(results) > 0
+        # One page of one result answers the question; don't paginate
+        # through every duplicate the way query_database would
+        data = self._request(
+            "POST",
+            f"/databases/{database_id}/query",
+            json={"page_size": 1, "filter": filter_obj},
+        )
+        return bool(data.get("results"))
 
     def batch_check_existing_pocket_ids(
         self,
@@ -247,7 +298,9 @@ class NotionClient:
         """Check which pocket_ids already exist in the database.
 
         Uses OR filter to check multiple IDs in a single query.
-        Chunks large lists to stay within Notion's filter limits.
+        Chunks large lists to stay within Notion's filter limits; the chunk
+        queries run concurrently (bounded by the shared rate limiter) so
+        their round-trips overlap.
 
         Args:
             database_id: Target database
@@ -261,32 +314,53 @@ class NotionClient:
             return set()
 
         logger.debug("Checking %d pocket_ids for duplicates", len(pocket_ids))
-        existing = set()
         chunk_size = 100  # Notion OR filter limit
+        chunks = [
+            pocket_ids[i:i + chunk_size]
+            for i in range(0, len(pocket_ids), chunk_size)
+        ]
 
-        for i in range(0, len(pocket_ids), chunk_size):
-            chunk = pocket_ids[i:i + chunk_size]
-
-            # Build OR filter
-            filter_obj = {
-                "or": [
-                    {"property": pocket_id_property, "rich_text": {"equals": pid}}
-                    for pid in chunk
-                ]
-            }
+        def check_chunk(chunk: list[str]) -> set[str]:
+            return self._existing_pocket_ids(database_id, chunk, pocket_id_property)
 
-            results = self.query_database(database_id, filter_obj)
+        if len(chunks) == 1:
+            existing = check_chunk(chunks[0])
+        else:
+            from concurrent.futures import ThreadPoolExecutor
 
-            # Extract pocket_ids from results
-            for page in results:
-                prop = page.get("properties", {}).get(pocket_id_property, {})
-                rich_text = prop.get("rich_text", [])
-                if rich_text:
-                    existing.add(rich_text[0].get("plain_text", ""))
+            workers = min(len(chunks), MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                existing = set().union(*executor.map(check_chunk, chunks))
 
         logger.debug("Found %d existing pocket_ids", len(existing))
         return existing
 
+    def _existing_pocket_ids(
+        self,
+        database_id: str,
+        pocket_ids: list[str],
+        pocket_id_property: str,
+    ) -> set[str]:
+        """Query one OR-filter chunk and return the pocket_ids found."""
+        # Build OR filter
+        filter_obj = {
+            "or": [
+                {"property": pocket_id_property, "rich_text": {"equals": pid}}
+                for pid in pocket_ids
+            ]
+        }
+
+        results = self.query_database(database_id, filter_obj)
+
+        # Extract pocket_ids from results
+        existing = set()
+        for page in results:
+            prop = page.get("properties", {}).get(pocket_id_property, {})
+            rich_text = prop.get("rich_text", [])
+            if rich_text:
+                existing.add(rich_text[0].get("plain_text", ""))
+        return existing
+
     def create_page(
         self,
         database_id: str,
@@ -333,37 +407,41 @@ class NotionClient:
         Returns:
             Updated database object
         """
-        # Build property config based on type
-        property_config: dict = {}
-        if property_type == "rich_text":
-            property_config = {"rich_text": {}}
-        elif property_type == "url":
-            property_config = {"url": {}}
-        elif property_type == "select":
-            property_config = {"select": {"options": []}}
-        elif property_type == "date":
-            property_config = {"date": {}}
-        elif property_type == "checkbox":
-            property_config = {"checkbox": {}}
-        elif property_type == "multi_select":
-            property_config = {"multi_select": {"options": []}}
-        else:
-            logger.warning(
-                "Unknown property type '%s' for '%s', defaulting to rich_text",
-                property_type,
-                property_name,
-            )
-            property_config = {"rich_text": {}}
+        return self.create_properties(database_id, [(property_name, property_type)])
+
+    def create_properties(
+        self,
+        database_id: str,
+        properties: list[tuple[str, str]],
+    ) -> dict:
+        """Add several properties to a database in a single request.
+
+        Args:
+            database_id: Target database ID
+            properties: List of (property_name, property_type) pairs
 
+        Returns:
+            Updated database object
+        """
         payload = {
             "properties": {
-                property_name: property_config,
+                name: _property_config(name, prop_type)
+                for name, prop_type in properties
             }
         }
 
-        logger.info("Creating property '%s' (%s) in database %s",
-                   property_name, property_type, database_id[:8])
-        return self._request("PATCH", f"/databases/{database_id}", json=payload)
+        logger.info("Creating %d properties in database %s: %s",
+                   len(properties), database_id[:8],
+                   ", ".join(f"{name} ({prop_type})" for name, prop_type in properties))
+        db = self._request("PATCH", f"/databases/{database_id}", json=payload)
+
+        # The response is the updated database; keep its schema instead of
+        # serving a stale one (or drop the entry if it isn't included)
+        if "properties" in db:
+            self._schema_cache[database_id] = (time.monotonic(), db["properties"])
+        else:
+            self._schema_cache.pop(database_id, None)
+        return db
 
     def ensure_properties_exist(
         self,
@@ -380,16 +458,19 @@ class NotionClient:
         Returns:
             List of created property names
         """
-        schema = self.get_database_schema(database_id)
-        existing = set(schema.keys())
-        created = []
+        if not required_properties:
+            return []
 
-        for prop_name, prop_type in required_properties.items():
-            if prop_name not in existing:
-                self.create_property(database_id, prop_name, prop_type)
-                created.append(prop_name)
-
-        if created:
+        schema = self.get_database_schema(database_id)
+        missing = [
+            (prop_name, prop_type)
+            for prop_name, prop_type in required_properties.items()
+            if prop_name not in schema
+        ]
+        created = [prop_name for prop_name, _ in missing]
+
+        if missing:
+            self.create_properties(database_id, missing)
             logger.info("Created %d missing properties: %s", len(created), ", ".join(created))
 
         return created
@@ -10,20 +10,26 @@ Includes:
 from __future__ import annotations
 
 import contextlib
+import json
+import logging
 import os
 import time
 from datetime import datetime, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from powerflow.models import ActionItem, Recording
+from powerflow.utils.jsonio import json_loads
 from powerflow.utils.logging import get_logger, log_api_call
 from powerflow.utils.reliability import (
     DEFAULT_TIMEOUT,
+    OVERLOAD_STATUS_CODES,
     RetryConfig,
     calculate_backoff,
     get_pocket_limiter,
     is_retriable_error,
+    parse_retry_after,
 )
 
 logger = get_logger(__name__)
@@ -35,6 +41,14 @@ BASE_URL = os.getenv("POCKET_API_URL", DEFAULT_BASE_URL)
 # Pocket web app URL for recording links
 POCKET_WEB_URL = "https://heypocket.com"
 
+# Concurrent recording detail fetches; matches the 5 req/sec Pocket limiter,
+# which still caps the overall rate
+DETAIL_FETCH_WORKERS = 5
+
+# Minimum kept-alive connections to the Pocket host, so concurrent detail
+# fetches reuse open TLS connections instead of discarding extras
+POOL_MAXSIZE = 16
+
 # Retry configuration for Pocket API
 POCKET_RETRY_CONFIG = RetryConfig(
     max_attempts=3,
@@ -64,23 +78,44 @@ def parse_datetime(dt_str: str | None) -> datetime | None:
 class PocketClient:
     """Client for Pocket AI API with reliability features."""
 
-    def __init__(self, api_key: str, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30.0,
+        max_workers: int = DETAIL_FETCH_WORKERS,
+    ) -> None:
         """Initialize Pocket client.
 
         Args:
             api_key: Pocket AI API key
             timeout: Request timeout in seconds
+            max_workers: Recording detail requests in flight at once
         """
         self.api_key = api_key
         self.timeout = timeout
+        self.max_workers = max_workers
         self.session = requests.Session()
         self.session.headers.update({
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         })
+        # Single host, so one pool sized for every worker thread
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(max_workers, POOL_MAXSIZE))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self._rate_limiter = get_pocket_limiter()
         logger.debug("PocketClient initialized")
 
+    def close(self) -> None:
+        """Close the session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> PocketClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _request(self, method: str, endpoint: str, **kwargs) -> dict:
         """Make an API request with retry, rate limiting, and timeout.
 
@@ -108,10 +143,10 @@ class PocketClient:
             # Rate limiting: wait for token
             self._rate_limiter.wait()
 
-            start_time = time.monotonic()
+            start_ns = time.perf_counter_ns()
             try:
                 response = self.session.request(method, url, **kwargs)
-                duration_ms = (time.monotonic() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
                 log_api_call(
                     logger,
@@ -122,20 +157,34 @@ class PocketClient:
                 )
 
                 response.raise_for_status()
-                return response.json()
+                self._rate_limiter.recover()
+                try:
+                    return json_loads(response.content)
+                except json.JSONDecodeError as e:
+                    # Surface as requests' own error, like response.json() did
+                    raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
 
-            except requests.exceptions.HTTPError as e:
+            except requests.exceptions.RequestException as e:
                 last_error = e
-                duration_ms = (time.monotonic() - start_time) * 1000
+                error_response = (
+                    e.response if isinstance(e, requests.exceptions.HTTPError) else None
+                )
+                status_code = error_response.status_code if error_response is not None else None
+
+                # Back off the shared request rate while the API is overloaded
+                if status_code in OVERLOAD_STATUS_CODES:
+                    self._rate_limiter.throttle()
 
                 # Check for rate limit with Retry-After header
-                if e.response is not None and e.response.status_code == 429:
-                    retry_after = e.response.headers.get("Retry-After")
-                    if retry_after:
-                        delay = float(retry_after)
+                if error_response is not None and status_code == 429:
+                    delay = parse_retry_after(
+                        error_response.headers.get("Retry-After"),
+                        POCKET_RETRY_CONFIG.max_delay,
+                    )
+                    if delay is not None:
                         logger.warning(
-                            "Rate limited, waiting %s seconds (Retry-After header)",
-                            retry_after,
+                            "Rate limited, waiting %.1f seconds (Retry-After header)",
+                            delay,
                         )
                         time.sleep(delay)
                         continue
@@ -160,30 +209,6 @@ class PocketClient:
                 )
                 time.sleep(delay)
 
-            except requests.exceptions.RequestException as e:
-                last_error = e
-                duration_ms = (time.monotonic() - start_time) * 1000
-
-                if not is_retriable_error(e, POCKET_RETRY_CONFIG):
-                    log_api_call(logger, method, url, error=str(e))
-                    raise
-
-                if attempt >= POCKET_RETRY_CONFIG.max_attempts:
-                    log_api_call(logger, method, url, error=f"Max retries exceeded: {e}")
-                    raise
-
-                delay = calculate_backoff(attempt, POCKET_RETRY_CONFIG)
-                logger.warning(
-                    "Retry %d/%d for %s %s in %.1fs: %s",
-                    attempt,
-                    POCKET_RETRY_CONFIG.max_attempts,
-                    method,
-                    endpoint,
-                    delay,
-                    e,
-                )
-                time.sleep(delay)
-
         # Should not reach here
         if last_error:
             raise last_error
@@ -199,7 +224,8 @@ class PocketClient:
 
     def get_recording_details(self, recording_id: str) -> dict:
         """Get a single recording with full details including summarizations."""
-        logger.debug("Fetching details for recording %s", recording_id[:8])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching details for recording %s", recording_id[:8])
         data = self._request("GET", f"/public/recordings/{recording_id}")
         return data.get("data", {})
 
@@ -218,7 +244,9 @@ class PocketClient:
         """Fetch all recordings, optionally filtered by created_at timestamp.
 
         Note: This uses N+1 API pattern (list + individual details).
-        Acceptable because Pocket API doesn't support batch detail fetch.
+        Acceptable because Pocket API doesn't support batch detail fetch;
+        the detail requests run concurrently (up to max_workers) so their
+        round-trips overlap. Results keep the list endpoint's order.
 
         Args:
             since: Only fetch recordings created after this time. If None, fetch all.
@@ -237,6 +265,7 @@ class PocketClient:
             f" since {since.isoformat()}" if since else "",
         )
 
+        recording_ids = []
         for rec in raw_list:
             recording_id = rec.get("id")
             if not recording_id:
@@ -249,21 +278,32 @@ class PocketClient:
                     skipped += 1
                     continue  # Skip recordings before since
 
-            # Get full recording details
-            try:
-                full_rec = self.get_recording_details(recording_id)
-                recording = self._parse_recording(full_rec)
-                if recording:
-                    recordings.append(recording)
-            except requests.RequestException as e:
+            recording_ids.append(recording_id)
+
+        # Get full recording details, overlapping the round-trips when there
+        # are several; the shared rate limiter still paces the requests
+        if len(recording_ids) > 1 and self.max_workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            workers = min(len(recording_ids), self.max_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._get_details_or_error, recording_ids))
+        else:
+            results = [self._get_details_or_error(rid) for rid in recording_ids]
+
+        for recording_id, full_rec in zip(recording_ids, results, strict=True):
+            if isinstance(full_rec, requests.RequestException):
                 # Log but continue with others (error accumulation pattern)
                 logger.warning(
                     "Failed to fetch recording %s: %s",
                     recording_id[:8],
-                    e,
+                    full_rec,
                 )
                 failed += 1
                 continue
+            recording = self._parse_recording(full_rec)
+            if recording:
+                recordings.append(recording)
 
         logger.info(
             "Fetched %d recordings (skipped=%d, failed=%d)",
@@ -273,6 +313,13 @@ class PocketClient:
         )
         return recordings
 
+    def _get_details_or_error(self, recording_id: str) -> dict | requests.RequestException:
+        """Fetch recording details, returning a request error instead of raising."""
+        try:
+            return self.get_recording_details(recording_id)
+        except requests.RequestException as e:
+            return e
+
     def _parse_recording(self, data: dict) -> Recording | None:
         """Parse raw API response into a Recording object."""
         recording_id = data.get("id")
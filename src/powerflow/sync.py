@@ -14,14 +14,58 @@ from datetime import datetime, timezone
 
 import requests
 
-from powerflow.config import Config
-from powerflow.models import SyncResult
+from powerflow.config import CONFIG_DIR, Config
+from powerflow.models import SyncResult, property_builder
 from powerflow.notion import NotionClient
 from powerflow.pocket import PocketClient
+from powerflow.utils.jsonio import json_dumps, json_loads
 from powerflow.utils.logging import get_logger, log_sync_result
 
 logger = get_logger(__name__)
 
+# Seconds a pending count stays fresh; status checks within this window reuse it
+PENDING_CACHE_TTL = 60.0
+
+# Last successful pending count, kept on disk so separate `powerflow status`
+# runs (e.g. from a shell prompt) can reuse it
+PENDING_CACHE_FILE = CONFIG_DIR / "pending_cache.json"
+
+
+def clear_pending_cache() -> None:
+    """Forget the cached pending count."""
+    PENDING_CACHE_FILE.unlink(missing_ok=True)
+
+
+def _read_pending_cache(
+    database_id: str | None, last_sync: str | None, max_age: float
+) -> int | None:
+    """Return the cached count for this database and last_sync, if fresh enough."""
+    if max_age <= 0:
+        return None
+    try:
+        cached = json_loads(PENDING_CACHE_FILE.read_bytes())
+        # Wall-clock age, since the count is written by an earlier process
+        fresh = 0 <= time.time() - cached["checked_at"] < max_age
+        if fresh and (cached["database_id"], cached["last_sync"]) == (database_id, last_sync):
+            return int(cached["count"])
+    except (OSError, ValueError, TypeError, KeyError):
+        pass  # Missing or unreadable cache is just a miss
+    return None
+
+
+def _write_pending_cache(database_id: str | None, last_sync: str | None, count: int) -> None:
+    """Store a freshly computed pending count."""
+    payload = {
+        "database_id": database_id,
+        "last_sync": last_sync,
+        "checked_at": time.time(),
+        "count": count,
+    }
+    try:
+        PENDING_CACHE_FILE.write_bytes(json_dumps(payload, indent=False))
+    except OSError as e:
+        logger.debug("Could not write pending count cache: %s", e)
+
 
 def parse_last_sync(last_sync: str | None) -> datetime | None:
     """Parse last_sync string into timezone-aware datetime."""
@@ -102,20 +146,25 @@ class SyncEngine:
 
         logger.info("Found %d recordings to process", len(recordings))
 
-        # Batch check which recordings already exist
-        pocket_ids = [rec.pocket_id for rec in recordings]
-        try:
-            existing_ids = self.notion.batch_check_existing_pocket_ids(
-                database_id, pocket_ids, pocket_id_prop
-            )
-            logger.debug("Found %d existing recordings in Notion", len(existing_ids))
-        except requests.RequestException as e:
-            error_msg = f"Failed to check existing items: {e}"
-            logger.error(error_msg)
-            result.errors.append(error_msg)
-            return result
+        # Batch check which recordings already exist. Only recordings with
+        # finished AI processing can be created, so when none are ready the
+        # Notion query is skipped entirely.
+        pocket_ids = [rec.pocket_id for rec in recordings if rec.is_summary_complete]
+        existing_ids: set[str] = set()
+        if pocket_ids:
+            try:
+                existing_ids = self.notion.batch_check_existing_pocket_ids(
+                    database_id, pocket_ids, pocket_id_prop
+                )
+                logger.debug("Found %d existing recordings in Notion", len(existing_ids))
+            except requests.RequestException as e:
+                error_msg = f"Failed to check existing items: {e}"
+                logger.error(error_msg)
+                result.errors.append(error_msg)
+                return result
 
-        # Process each recording
+        # Process each recording; the property map is resolved once per sync
+        build_properties = property_builder(property_map)
         for recording in recordings:
             try:
                 # Check for duplicate using batch result
@@ -137,7 +186,7 @@ class SyncEngine:
 
                 # Create in Notion with rich body content and icon
                 if not dry_run:
-                    properties = recording.to_notion_properties(property_map)
+                    properties = build_properties(recording)
                     children = recording.to_notion_children()
                     icon = recording.get_icon()
                     self.notion.create_page(database_id, properties, children, icon)
@@ -168,13 +217,22 @@ class SyncEngine:
 
         return result
 
-    def get_pending_count(self) -> int:
+    def get_pending_count(self, max_age: float = PENDING_CACHE_TTL) -> int:
         """Get count of recordings that would be synced (not yet in Notion).
 
         Only counts recordings that:
         1. Don't already exist in Notion (dedup check)
         2. Have completed AI processing (summary check)
 
+        Successful counts are cached on disk per database and last_sync
+        timestamp, so repeated status checks (each its own process) skip the
+        Pocket and Notion round-trips. A sync that moves last_sync
+        invalidates the entry.
+
+        Args:
+            max_age: Reuse a cached count no older than this many seconds.
+                Pass 0 to always query the APIs.
+
         Returns:
             Count of ready-to-sync recordings, or 0 on error
         """
@@ -182,9 +240,15 @@ class SyncEngine:
             return 0
 
         database_id = self.config.notion.database_id
+        raw_last_sync = self.config.pocket.last_sync
+        cached = _read_pending_cache(database_id, raw_last_sync, max_age)
+        if cached is not None:
+            logger.debug("Using cached pending count: %d", cached)
+            return cached
+
         property_map = self.config.notion.property_map
         pocket_id_prop = property_map.get("pocket_id", "Inbox ID")
-        last_sync = parse_last_sync(self.config.pocket.last_sync)
+        last_sync = parse_last_sync(raw_last_sync)
 
         try:
             recordings = self.pocket.fetch_recordings(since=last_sync)
@@ -192,11 +256,14 @@ class SyncEngine:
             logger.warning("Failed to fetch recordings for pending count: %s", e)
             return 0
 
-        if not recordings:
+        # Only recordings that have completed AI processing can count, so
+        # skip the Notion dedup query when none are ready
+        pocket_ids = [rec.pocket_id for rec in recordings if rec.is_summary_complete]
+        if not pocket_ids:
+            _write_pending_cache(database_id, raw_last_sync, 0)
             return 0
 
         # Batch check existing
-        pocket_ids = [rec.pocket_id for rec in recordings]
         try:
             existing_ids = self.notion.batch_check_existing_pocket_ids(
                 database_id, pocket_ids, pocket_id_prop
@@ -207,8 +274,31 @@ class SyncEngine:
             return -1
 
         # Count only recordings that are both new AND have completed AI processing
-        ready_count = sum(
-            1 for rec in recordings
-            if rec.pocket_id not in existing_ids and rec.is_summary_complete
-        )
+        ready_count = sum(1 for pid in pocket_ids if pid not in existing_ids)
+        _write_pending_cache(database_id, raw_last_sync, ready_count)
         return ready_count
+
+
+# Process-wide engine and the API keys its clients were built with
+_ENGINE: tuple[tuple[str, str], SyncEngine] | None = None
+
+
+def get_engine(config: Config, pocket_key: str, notion_key: str) -> SyncEngine:
+    """Return a SyncEngine whose API clients are reused across calls.
+
+    Keeping the clients (and their requests.Session connection pools) alive
+    lets a long-running daemon reuse open connections between sync ticks
+    instead of re-doing TCP and TLS handshakes. The clients are rebuilt only
+    when an API key changes; the engine always uses the config passed in.
+    """
+    global _ENGINE
+
+    keys = (pocket_key, notion_key)
+    if _ENGINE is not None and _ENGINE[0] == keys:
+        engine = _ENGINE[1]
+        engine.config = config
+        return engine
+
+    engine = SyncEngine(PocketClient(pocket_key), NotionClient(notion_key), config)
+    _ENGINE = (keys, engine)
+    return engine
@@ -1,13 +1,20 @@
 """Utility modules for powerflow."""
 
+from __future__ import annotations
+
+from typing import Any
+
 from powerflow.utils.logging import get_logger, setup_logging
-from powerflow.utils.reliability import (
-    RateLimiter,
-    RetryConfig,
-    is_retriable_error,
-    with_retry,
-    with_timeout,
-)
+
+# Reliability helpers pull in `requests`; resolve them on first access so that
+# importing the logging helpers stays cheap for CLI startup.
+_RELIABILITY_EXPORTS = frozenset({
+    "RateLimiter",
+    "RetryConfig",
+    "is_retriable_error",
+    "with_retry",
+    "with_timeout",
+})
 
 __all__ = [
     "RetryConfig",
@@ -18,3 +25,11 @@ __all__ = [
     "get_logger",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _RELIABILITY_EXPORTS:
+        from powerflow.utils import reliability
+
+        return getattr(reliability, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,70 @@
+"""JSON encoding helpers shared by the config, daemon state and API clients.
+
+orjson is used when installed (pip install powerflow[fast]); otherwise the
+stdlib json module. Both write non-ASCII text as raw UTF-8 and datetimes as
+ISO 8601, so plain data and datetimes come out the same either way. Other
+types orjson encodes natively (dataclasses, UUIDs, ...) go through the
+`default` callback on the stdlib path.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from datetime import date, time
+from typing import Any
+
+try:  # Optional fast path: pip install powerflow[fast]
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _iso_default(default: Callable[[Any], Any] | None) -> Callable[[Any], Any]:
+    """Wrap a stdlib `default` so dates encode as ISO 8601, like orjson."""
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, (date, time)):  # date includes datetime
+            return value.isoformat()
+        if default is None:
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+        return default(value)
+
+    return encode
+
+
+def json_dumps(
+    data: Any,
+    default: Callable[[Any], Any] | None = None,
+    indent: bool = True,
+) -> bytes:
+    """Serialize data as JSON bytes, using orjson when installed.
+
+    Non-str dict keys (int, float, bool, None) are stringified the way the
+    stdlib does, rather than raising TypeError as plain orjson would.
+
+    Args:
+        data: Object to serialize
+        default: Fallback for values JSON can't represent (e.g. str)
+        indent: Pretty-print with 2-space indentation; False for compact
+            output (request bodies)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=option)
+    if indent:
+        text = json.dumps(data, indent=2, ensure_ascii=False, default=_iso_default(default))
+    else:
+        text = json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False, default=_iso_default(default)
+        )
+    return text.encode()
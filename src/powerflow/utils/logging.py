@@ -21,7 +21,6 @@ from __future__ import annotations
 
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
@@ -154,6 +153,8 @@ def setup_logging(
 
     # File handler with rotation
     if log_file:
+        from logging.handlers import RotatingFileHandler
+
         log_path = Path(log_file).expanduser()
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -230,6 +231,18 @@ def log_api_call(
         duration_ms: Request duration in milliseconds
         error: Error message (if failed)
     """
+    if error:
+        level = logging.WARNING
+    elif status_code:
+        level = logging.DEBUG if status_code < 400 else logging.WARNING
+    else:
+        return
+
+    # Runs for every request; skip the string work when the level is off
+    # (successful calls log at DEBUG, which is usually disabled)
+    if not logger.isEnabledFor(level):
+        return
+
     # Truncate URL for readability
     display_url = url[:80] + "..." if len(url) > 80 else url
 
@@ -240,8 +253,7 @@ def log_api_call(
             display_url,
             error,
         )
-    elif status_code:
-        level = logging.DEBUG if status_code < 400 else logging.WARNING
+    else:
         duration_str = f" ({duration_ms:.0f}ms)" if duration_ms else ""
         logger.log(
             level,
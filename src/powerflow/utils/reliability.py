@@ -25,10 +25,12 @@ Usage:
 from __future__ import annotations
 
 import logging
+import math
 import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from functools import wraps
 from typing import TYPE_CHECKING, TypeVar
 
@@ -70,6 +72,9 @@ class RetryConfig:
 
 DEFAULT_RETRY_CONFIG = RetryConfig()
 
+# Status codes meaning "slow down": these throttle the client's rate limiter
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
 
 def is_retriable_error(
     error: Exception,
@@ -120,6 +125,42 @@ def calculate_backoff(
     return min(delay, config.max_delay)
 
 
+def parse_retry_after(value: str | None, max_delay: float) -> float | None:
+    """Parse a Retry-After header into a delay in seconds.
+
+    Accepts both forms allowed by RFC 9110: delta-seconds ("120") and an
+    HTTP-date ("Wed, 21 Oct 2015 07:28:00 GMT").
+
+    Args:
+        value: Raw header value (None if the header is absent)
+        max_delay: Upper bound for the returned delay
+
+    Returns:
+        Delay clamped to [0, max_delay], or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+
+    try:
+        delay = float(value)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+
+    if not math.isfinite(delay):
+        return None
+
+    return min(max(delay, 0.0), max_delay)
+
+
 def with_retry(
     max_attempts: int = 3,
     base_delay: float = 1.0,
@@ -222,6 +263,10 @@ class RateLimiter:
 
     Thread-safe implementation for controlling API request rate.
 
+    The rate adapts AIMD-style: throttle() halves it when the API pushes
+    back, recover() adds it back in small steps after successful calls,
+    never exceeding the configured rate.
+
     Example:
         limiter = RateLimiter(calls_per_second=3)
 
@@ -234,19 +279,49 @@ class RateLimiter:
         self,
         calls_per_second: float = 3.0,
         burst_size: int | None = None,
+        min_calls_per_second: float | None = None,
     ) -> None:
         """Initialize rate limiter.
 
         Args:
             calls_per_second: Maximum sustained request rate
             burst_size: Maximum burst size (defaults to calls_per_second)
+            min_calls_per_second: Floor for throttle() (defaults to 1/8 of
+                calls_per_second)
         """
         self.calls_per_second = calls_per_second
+        self.max_calls_per_second = calls_per_second
+        self.min_calls_per_second = (
+            min_calls_per_second if min_calls_per_second is not None
+            else calls_per_second / 8
+        )
+        # Additive increase: ten successes restore a full calls_per_second
+        self.recovery_step = calls_per_second / 10
         self.burst_size = burst_size if burst_size is not None else int(calls_per_second)
         self.tokens = float(self.burst_size)
         self.last_update = time.monotonic()
         self._lock = threading.Lock()
 
+    def throttle(self) -> None:
+        """Halve the request rate after the API signalled overload (e.g. 429)."""
+        with self._lock:
+            self._refill()  # Credit elapsed time at the old rate first
+            self.calls_per_second = max(
+                self.min_calls_per_second,
+                self.calls_per_second / 2,
+            )
+
+    def recover(self) -> None:
+        """Step the request rate back towards its maximum after a success."""
+        if self.calls_per_second >= self.max_calls_per_second:
+            return  # Common case: not throttled, skip the lock
+        with self._lock:
+            self._refill()
+            self.calls_per_second = min(
+                self.max_calls_per_second,
+                self.calls_per_second + self.recovery_step,
+            )
+
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
         now = time.monotonic()
@@ -260,6 +335,10 @@ class RateLimiter:
     def acquire(self, blocking: bool = True, timeout: float | None = None) -> bool:
         """Acquire a token from the bucket.
 
+        A blocking caller that finds the bucket empty reserves the next
+        token (the balance may go negative, queueing later callers behind
+        it) and then sleeps exactly until its slot, outside the lock.
+
         Args:
             blocking: If True, block until token available
             timeout: Maximum time to wait (None = infinite)
@@ -267,34 +346,25 @@ class RateLimiter:
         Returns:
             True if token acquired, False if timeout
         """
-        deadline = None if timeout is None else time.monotonic() + timeout
-
         with self._lock:
-            while True:
-                self._refill()
+            self._refill()
 
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    return True
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
 
-                if not blocking:
-                    return False
+            if not blocking:
+                return False
 
-                # Calculate wait time for next token
-                wait_time = (1 - self.tokens) / self.calls_per_second
+            # Time until our token accrues, computed rather than polled
+            wait_time = (1 - self.tokens) / self.calls_per_second
+            if timeout is not None and wait_time > timeout:
+                return False
 
-                if deadline is not None:
-                    remaining = deadline - time.monotonic()
-                    if remaining <= 0:
-                        return False
-                    wait_time = min(wait_time, remaining)
+            self.tokens -= 1
 
-                # Release lock while sleeping
-                self._lock.release()
-                try:
-                    time.sleep(wait_time)
-                finally:
-                    self._lock.acquire()
+        time.sleep(wait_time)
+        return True
 
     def wait(self, timeout: float | None = None) -> bool:
         """Wait until rate limit allows a request.
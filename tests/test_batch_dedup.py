@@ -1,5 +1,7 @@
 """Tests for batch deduplication (v0.3)."""
 
+import threading
+import time
 from unittest.mock import MagicMock
 
 from powerflow.notion import NotionClient
@@ -98,3 +100,35 @@ class TestBatchDedup:
         client.batch_check_existing_pocket_ids("db123", pocket_ids, "Inbox ID")
 
         assert call_count == 2
+
+    def test_batch_check_chunks_run_concurrently(self):
+        """Chunk queries should overlap and their results be merged."""
+        client = NotionClient("fake_key")
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def mock_request(method, endpoint, json):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            first = json["filter"]["or"][0]["rich_text"]["equals"]
+            return {
+                "results": [
+                    {"properties": {"Inbox ID": {"rich_text": [{"plain_text": first}]}}}
+                ],
+                "has_more": False,
+            }
+
+        client._request = mock_request
+
+        # 300 items -> 3 chunks, each reporting its first id as existing
+        pocket_ids = [f"pocket:{i}:0" for i in range(300)]
+        existing = client.batch_check_existing_pocket_ids("db123", pocket_ids, "Inbox ID")
+
+        assert existing == {"pocket:0:0", "pocket:100:0", "pocket:200:0"}
+        assert max_in_flight > 1
@@ -12,6 +12,9 @@ from powerflow.blocks import (
     create_toggle,
     format_duration,
     get_priority_style,
+    iter_markdown_blocks,
+    parse_bold_segments,
+    parse_markdown_to_blocks,
     safe_text,
 )
 
@@ -133,6 +136,15 @@ class TestCreateBullet:
         assert rich_text[0]["annotations"]["bold"] is True
         assert rich_text[0]["text"]["content"] == "Label: "
 
+    def test_bold_prefix_not_shared_between_bullets(self):
+        first = create_bullet("a", bold_prefix="Label")
+        first["bulleted_list_item"]["rich_text"][0]["text"]["content"] = "Changed"
+        first["bulleted_list_item"]["rich_text"][0]["annotations"]["color"] = "red"
+
+        label = create_bullet("b", bold_prefix="Label")["bulleted_list_item"]["rich_text"][0]
+        assert label["text"]["content"] == "Label: "
+        assert label["annotations"]["color"] == "default"
+
 
 class TestCreateParagraph:
     """Tests for create_paragraph function."""
@@ -202,3 +214,69 @@ class TestGetPriorityStyle:
     def test_unknown_priority_defaults(self):
         style = get_priority_style("critical")
         assert style["icon"] == "💡"  # Falls back to None style
+
+
+class TestParseBoldSegments:
+    """Tests for parse_bold_segments function."""
+
+    def test_plain_text_single_segment(self):
+        result = parse_bold_segments("No markers here")
+        assert len(result) == 1
+        assert result[0]["text"]["content"] == "No markers here"
+        assert "annotations" not in result[0]
+
+    def test_bold_segments_split(self):
+        result = parse_bold_segments("Hello **world** and **foo**")
+        contents = [seg["text"]["content"] for seg in result]
+        assert contents == ["Hello ", "world", " and ", "foo"]
+        assert result[1]["annotations"]["bold"] is True
+        assert result[3]["annotations"]["bold"] is True
+        assert "annotations" not in result[0]
+
+    def test_bold_segments_do_not_share_annotations(self):
+        first = parse_bold_segments("x **a** y")
+        first[1]["annotations"]["color"] = "red"
+
+        assert parse_bold_segments("**b**")[0]["annotations"]["color"] == "default"
+        assert create_rich_text("z", bold=True)["annotations"]["color"] == "default"
+
+    def test_unclosed_marker_kept_as_text(self):
+        result = parse_bold_segments("Open **marker only")
+        assert len(result) == 1
+        assert result[0]["text"]["content"] == "Open **marker only"
+
+    def test_stray_asterisks_match_regex_semantics(self):
+        result = parse_bold_segments("***a** and ****")
+        contents = [seg["text"]["content"] for seg in result]
+        assert contents == ["*", "a", " and ****"]
+        assert result[1]["annotations"]["bold"] is True
+
+
+class TestParseMarkdownToBlocks:
+    """Tests for parse_markdown_to_blocks function."""
+
+    def test_empty_returns_no_blocks(self):
+        assert parse_markdown_to_blocks("") == []
+
+    def test_whitespace_only_returns_no_blocks(self):
+        assert parse_markdown_to_blocks("  \n\t\r\n ") == []
+
+    def test_block_types(self):
+        blocks = parse_markdown_to_blocks("### Heading\n\n- Item\nPlain line")
+        assert [b["type"] for b in blocks] == ["heading_3", "bulleted_list_item", "paragraph"]
+
+    def test_indented_bullet(self):
+        blocks = parse_markdown_to_blocks("  -   Nested item  ")
+        assert blocks[0]["type"] == "bulleted_list_item"
+        assert blocks[0]["bulleted_list_item"]["rich_text"][0]["text"]["content"] == "Nested item"
+
+    def test_crlf_line_endings(self):
+        blocks = parse_markdown_to_blocks("### Title\r\n- Item\r\n")
+        assert blocks[0]["heading_3"]["rich_text"][0]["text"]["content"] == "Title"
+        assert blocks[1]["bulleted_list_item"]["rich_text"][0]["text"]["content"] == "Item"
+
+    def test_iter_matches_list(self):
+        markdown = "### Title\n- **Bold** item\nPlain line"
+        blocks = iter_markdown_blocks(markdown)
+        assert not isinstance(blocks, list)
+        assert list(blocks) == parse_markdown_to_blocks(markdown)
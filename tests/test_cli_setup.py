@@ -0,0 +1,121 @@
+"""Tests for the setup wizard."""
+
+from unittest.mock import MagicMock, patch
+
+from powerflow.cli import cmd_setup, plan_property_mapping, verify_pocket_key
+
+
+class TestPlanPropertyMapping:
+    """Tests for plan_property_mapping."""
+
+    def test_empty_schema_creates_required_fields(self):
+        """Missing dedup/context/source/tags fields should be created."""
+        existing, to_create = plan_property_mapping({"Name": {"type": "title"}})
+
+        assert existing == [("Action Item", "Name", "existing")]
+        assert to_create == [
+            ("pocket_id", "Inbox ID", "rich_text"),
+            ("Context", "Action Context", "rich_text"),
+            ("Source", "Source", "url"),
+            ("Tags", "Tags", "multi_select"),
+        ]
+
+    def test_uses_first_candidate_with_matching_type(self):
+        """Candidates are tried in order and must have the expected type."""
+        schema = {
+            "Name": {"type": "title"},
+            "Priority": {"type": "select"},
+            "Due": {"type": "date"},
+            "Inbox ID": {"type": "number"},  # Wrong type, skipped
+            "Pocket ID": {"type": "rich_text"},
+            "Notes": {"type": "rich_text"},
+            "Details": {"type": "rich_text"},
+            "URL": {"type": "url"},
+            "Labels": {"type": "multi_select"},
+        }
+        existing, to_create = plan_property_mapping(schema)
+
+        assert ("Priority", "Priority", "existing") in existing
+        assert ("Due Date", "Due", "existing") in existing
+        assert ("pocket_id", "Pocket ID", "existing") in existing
+        assert ("Context", "Notes", "existing") in existing
+        assert ("Source", "URL", "existing") in existing
+        assert ("Tags", "Labels", "existing") in existing
+        assert to_create == []
+
+    def test_optional_fields_never_created(self):
+        """Priority and Due Date are optional."""
+        _, to_create = plan_property_mapping({"Priority": {"type": "rich_text"}})
+
+        created_fields = [field for field, _, _ in to_create]
+        assert "Priority" not in created_fields
+        assert "Due Date" not in created_fields
+
+    def test_candidate_order_beats_schema_order(self):
+        """Preferred candidate wins even if listed later in the schema."""
+        schema = {
+            "Source ID": {"type": "rich_text"},
+            "Inbox ID": {"type": "rich_text"},
+        }
+        existing, _ = plan_property_mapping(schema)
+
+        assert ("pocket_id", "Inbox ID", "existing") in existing
+
+    def test_names_match_case_insensitively(self):
+        """Schema names match regardless of case, keeping the schema's spelling."""
+        schema = {
+            "priority": {"type": "select"},
+            "DUE DATE": {"type": "date"},
+            "inbox id": {"type": "rich_text"},
+        }
+        existing, _ = plan_property_mapping(schema)
+
+        assert ("Priority", "priority", "existing") in existing
+        assert ("Due Date", "DUE DATE", "existing") in existing
+        assert ("pocket_id", "inbox id", "existing") in existing
+
+
+class TestSetupKeyVerification:
+    """Tests for API key verification during setup."""
+
+    def test_reports_both_key_failures(self, capsys):
+        """Both keys are verified, and both failures are reported."""
+        with (
+            patch("powerflow.cli.Config.load", return_value=MagicMock()),
+            patch("powerflow.cli.get_or_prompt_pocket_key", return_value="pk"),
+            patch("powerflow.cli.get_or_prompt_notion_key", return_value="ntn"),
+            patch("powerflow.cli.verify_pocket_key", return_value=(False, "bad pocket")),
+            patch("powerflow.cli.verify_notion_key", return_value=(False, "bad notion", None, [])),
+        ):
+            assert cmd_setup() == 1
+
+        err = capsys.readouterr().err
+        assert "Pocket: bad pocket" in err
+        assert "Notion: bad notion" in err
+
+    def test_reuses_databases_listed_during_verification(self):
+        """Setup should not search Notion again after verifying the key."""
+        notion = MagicMock()
+        notion.format_databases_for_display.return_value = []
+        databases = [{"id": "db1"}]
+        with (
+            patch("powerflow.cli.Config.load", return_value=MagicMock()),
+            patch("powerflow.cli.get_or_prompt_pocket_key", return_value="pk"),
+            patch("powerflow.cli.get_or_prompt_notion_key", return_value="ntn"),
+            patch("powerflow.cli.verify_pocket_key", return_value=(True, "")),
+            patch("powerflow.cli.verify_notion_key", return_value=(True, "", notion, databases)),
+        ):
+            assert cmd_setup() == 1  # No displayable databases
+
+        notion.search_databases.assert_not_called()
+        notion.format_databases_for_display.assert_called_once_with(databases)
+
+    def test_pocket_verification_closes_its_client(self):
+        """The throwaway Pocket client should release its connections."""
+        with (
+            patch("powerflow.pocket.PocketClient.get_recordings_list", return_value=[]),
+            patch("powerflow.pocket.PocketClient.close") as close,
+        ):
+            assert verify_pocket_key("pk_" + "a" * 40) == (True, "")
+
+        close.assert_called_once()
@@ -1,6 +1,9 @@
 """Tests for CLI API key validation."""
 
+from unittest.mock import patch
+
 from powerflow.cli import (
+    main,
     validate_notion_key_format,
     validate_pocket_key_format,
 )
@@ -81,3 +84,49 @@ class TestNotionKeyValidation:
         valid, error = validate_notion_key_format("secret_abc123defghijklmnop qrstuvwxyz")
         assert valid is False
         assert "whitespace" in error.lower()
+
+
+class TestMainDispatch:
+    """Tests for command dispatch in main()."""
+
+    def test_unknown_command_fails(self, capsys):
+        """Unknown commands should print an error and usage."""
+        assert main(["bogus"]) == 1
+        assert "Unknown command: bogus" in capsys.readouterr().err
+
+    def test_version_flag(self, capsys):
+        """-v and --version should print the version."""
+        assert main(["-v"]) == 0
+        assert main(["--version"]) == 0
+        assert capsys.readouterr().out.count("powerflow ") == 2
+
+    def test_command_name_is_case_insensitive(self):
+        """Commands should be matched regardless of case."""
+        with patch("powerflow.cli.cmd_sync", return_value=0) as cmd_sync:
+            assert main(["SYNC", "--dry-run"]) == 0
+        cmd_sync.assert_called_once_with(dry_run=True)
+
+
+class TestDaemonArgs:
+    """Tests for daemon subcommand flag parsing."""
+
+    def test_start_flags(self):
+        """--interval and --foreground should be parsed together."""
+        with patch("powerflow.daemon.start_daemon", return_value=0) as start:
+            assert main(["daemon", "start", "-f", "--interval", "1h"]) == 0
+        start.assert_called_once_with(60, foreground=True)
+
+    def test_start_defaults(self):
+        """Without flags, the default interval runs in the background."""
+        from powerflow.daemon import DEFAULT_INTERVAL_MINUTES
+
+        with patch("powerflow.daemon.start_daemon", return_value=0) as start:
+            assert main(["daemon", "start"]) == 0
+        start.assert_called_once_with(DEFAULT_INTERVAL_MINUTES, foreground=False)
+
+    def test_invalid_interval_fails(self, capsys):
+        """A bad interval should be reported without starting the daemon."""
+        with patch("powerflow.daemon.start_daemon") as start:
+            assert main(["daemon", "start", "--interval", "soon"]) == 1
+        start.assert_not_called()
+        assert "Invalid interval: soon" in capsys.readouterr().err
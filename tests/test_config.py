@@ -1,10 +1,20 @@
 """Tests for configuration management."""
 
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 from unittest.mock import patch
 
-from powerflow.config import Config, NotionConfig, PocketConfig
+import pytest
+
+from powerflow.config import (
+    Config,
+    NotionConfig,
+    PocketConfig,
+    get_pocket_api_key,
+    refresh_env,
+    validate_env,
+)
 
 
 class TestConfig:
@@ -54,6 +64,112 @@ class TestConfig:
                 config = Config.load()
                 assert config.is_configured is False
 
+    def test_load_returns_independent_copies(self):
+        """Cached loads should not share mutable state between callers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.json"
+
+            with patch("powerflow.config.CONFIG_FILE", config_file):
+                config = Config()
+                config.notion.database_id = "test-db-123"
+                config.save()
+
+                first = Config.load()
+                first.notion.property_map["title"] = "Changed"
+                first.notion.database_id = "other"
+
+                second = Config.load()
+                assert second.notion.database_id == "test-db-123"
+                assert second.notion.property_map["title"] == "Name"
+
+    def test_load_sees_external_changes(self):
+        """Editing the file outside Config.save should invalidate the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.json"
+
+            with patch("powerflow.config.CONFIG_FILE", config_file):
+                config_file.write_text('{"notion": {"database_id": "a"}}')
+                assert Config.load().notion.database_id == "a"
+
+                config_file.write_text('{"notion": {"database_id": "bcd"}}')
+                assert Config.load().notion.database_id == "bcd"
+
+    @pytest.mark.parametrize("backend", ["json", "orjson"])
+    def test_save_and_load_with_each_json_backend(self, backend, monkeypatch):
+        """Config should round-trip with both the stdlib and orjson backends."""
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("powerflow.utils.jsonio.orjson", None)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.json"
+
+            with patch("powerflow.config.CONFIG_FILE", config_file):
+                config = Config()
+                config.notion.database_name = "Boîte de réception"
+                config.save()
+
+                assert config_file.read_text().startswith('{\n  "notion"')
+                assert Config.load().notion.database_name == "Boîte de réception"
+
+    def test_load_corrupt_file_returns_default(self):
+        """Unparseable config should fall back to defaults."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.json"
+
+            with patch("powerflow.config.CONFIG_FILE", config_file):
+                config_file.write_text("{not json")
+                assert Config.load().is_configured is False
+
+    def test_save_creates_missing_directory(self):
+        """First save should create the config directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "nested" / "config.json"
+
+            with patch("powerflow.config.CONFIG_FILE", config_file):
+                Config().save()
+                assert config_file.exists()
+
+    def test_save_is_atomic_and_leaves_no_temp_files(self):
+        """A failed rename should keep the old file and clean up the temp file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.json"
+
+            with patch("powerflow.config.CONFIG_FILE", config_file):
+                config = Config()
+                config.notion.database_id = "old"
+                config.save()
+
+                config.notion.database_id = "new"
+                with (
+                    patch("powerflow.config.os.replace", side_effect=OSError("disk full")),
+                    pytest.raises(OSError),
+                ):
+                    config.save()
+
+                assert [p.name for p in Path(tmpdir).iterdir()] == ["config.json"]
+                assert Config.load().notion.database_id == "old"
+
+    def test_save_fsyncs_before_replace(self):
+        """The temp file should reach disk before it replaces the config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.json"
+            calls = []
+
+            with (
+                patch("powerflow.config.CONFIG_FILE", config_file),
+                patch("powerflow.config.os.fsync", side_effect=lambda fd: calls.append("fsync")),
+                patch(
+                    "powerflow.config.os.replace",
+                    side_effect=lambda *args: calls.append("replace"),
+                ),
+                patch.object(Path, "stat"),
+            ):
+                Config().save()
+
+            assert calls == ["fsync", "replace"]
+
     def test_update_last_sync(self):
         """update_last_sync should set timestamp."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -84,6 +200,21 @@ class TestNotionConfig:
         assert notion.property_map is not None
         assert isinstance(notion.property_map, dict)
 
+    def test_to_dict_matches_asdict(self):
+        """to_dict should serialize every field like dataclasses.asdict."""
+        config = NotionConfig(database_id="db", database_name="Inbox")
+        assert config.to_dict() == asdict(config)
+        assert PocketConfig(last_sync="2026-01-01").to_dict() == asdict(
+            PocketConfig(last_sync="2026-01-01")
+        )
+
+    def test_to_dict_copies_property_map(self):
+        """Mutating the config after serializing should not change the dict."""
+        config = NotionConfig()
+        data = config.to_dict()
+        config.property_map["title"] = "Changed"
+        assert data["property_map"]["title"] == "Name"
+
     def test_database_id_none_by_default(self):
         """database_id should be None by default."""
         notion = NotionConfig()
@@ -97,3 +228,31 @@ class TestPocketConfig:
         """last_sync should be None by default."""
         pocket = PocketConfig()
         assert pocket.last_sync is None
+
+
+class TestEnvSnapshot:
+    """Tests for cached API key environment lookups."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_snapshot(self):
+        refresh_env()
+        yield
+        refresh_env()
+
+    def test_validate_env_reports_missing(self, monkeypatch):
+        """Missing keys should be reported."""
+        monkeypatch.setenv("POCKET_API_KEY", "pk_test")
+        monkeypatch.delenv("NOTION_API_KEY", raising=False)
+
+        assert validate_env() == ["NOTION_API_KEY"]
+
+    def test_snapshot_until_refresh(self, monkeypatch):
+        """Keys are read once and re-read only after refresh_env()."""
+        monkeypatch.setenv("POCKET_API_KEY", "pk_old")
+        assert get_pocket_api_key() == "pk_old"
+
+        monkeypatch.setenv("POCKET_API_KEY", "pk_new")
+        assert get_pocket_api_key() == "pk_old"
+
+        refresh_env()
+        assert get_pocket_api_key() == "pk_new"
@@ -1,15 +1,33 @@
 """Tests for daemon functionality."""
 
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from powerflow.daemon import (
     DEFAULT_INTERVAL_MINUTES,
     MAX_RETRIES,
     RETRY_DELAY_SECONDS,
+    PowerFlowDaemon,
     parse_interval,
     send_notification,
+    wait_for_exit,
 )
 
 
+@pytest.fixture
+def daemon():
+    """A daemon with logging setup stubbed out."""
+    with patch("powerflow.daemon.setup_logging", return_value=MagicMock()):
+        return PowerFlowDaemon(interval_minutes=15)
+
+
 class TestParseInterval:
     """Tests for interval parsing."""
 
@@ -58,3 +76,146 @@ class TestNotifications:
         send_notification("Test", "Message")
         send_notification("", "")
         send_notification("Quote's \"test\"", "Line\nbreak")
+
+    def test_send_notification_does_not_wait(self):
+        """On macOS, osascript should be launched without waiting for it."""
+        with (
+            patch("powerflow.daemon.sys.platform", "darwin"),
+            patch("subprocess.Popen") as popen,
+            patch("subprocess.run") as run,
+        ):
+            send_notification("Title", "Body")
+
+        popen.assert_called_once()
+        assert popen.call_args[0][0][0] == "osascript"
+        popen.return_value.wait.assert_not_called()
+        run.assert_not_called()
+
+
+class TestShutdown:
+    """Tests for daemon shutdown handling."""
+
+    def test_shutdown_interrupts_interval_wait(self, daemon):
+        """A shutdown signal should end the wait between syncs immediately."""
+        sync_result = {"created": 0, "skipped": 0, "pending": 0, "failed": 0}
+
+        with (
+            patch.object(daemon, "_do_sync", return_value=sync_result),
+            patch("powerflow.daemon.write_pid"),
+            patch("powerflow.daemon.remove_pid"),
+            patch("powerflow.daemon.save_state"),
+            patch("powerflow.daemon.load_state", return_value={}),
+            patch("powerflow.daemon.send_notification"),
+            patch.object(daemon, "_watch_signals", return_value=None),
+        ):
+            timer = threading.Timer(0.1, daemon._request_shutdown, args=(signal.SIGTERM,))
+            timer.start()
+            start = time.monotonic()
+            daemon.run()
+            timer.join()
+
+        assert time.monotonic() - start < 5
+        assert daemon.running is False
+
+    @pytest.mark.skipif(not hasattr(signal, "pthread_sigmask"), reason="POSIX only")
+    def test_sigterm_is_handled_by_signal_thread(self, daemon):
+        """SIGTERM should stop the daemon via sigwait, then restore the signal mask."""
+        sync_result = {"created": 0, "skipped": 0, "pending": 0, "failed": 0}
+        mask_before = signal.pthread_sigmask(signal.SIG_BLOCK, set())
+
+        def sync_then_signal():
+            os.kill(os.getpid(), signal.SIGTERM)  # Blocked here, picked up by sigwait
+            return sync_result
+
+        with (
+            patch.object(daemon, "_do_sync", side_effect=sync_then_signal),
+            patch("powerflow.daemon.write_pid"),
+            patch("powerflow.daemon.remove_pid"),
+            patch("powerflow.daemon.save_state"),
+            patch("powerflow.daemon.load_state", return_value={}),
+            patch("powerflow.daemon.send_notification"),
+        ):
+            daemon.run()
+
+        assert daemon.running is False
+        assert signal.pthread_sigmask(signal.SIG_BLOCK, set()) == mask_before
+
+    @pytest.mark.skipif(not hasattr(signal, "pthread_sigmask"), reason="POSIX only")
+    def test_failed_startup_still_cleans_up(self, daemon):
+        """An error before the loop should still remove the PID file and restore the mask."""
+        previous_mask = {signal.SIGUSR1}
+        with (
+            patch.object(daemon, "_watch_signals", return_value=previous_mask),
+            patch("powerflow.daemon.write_pid"),
+            patch("powerflow.daemon.remove_pid") as remove_pid,
+            patch("powerflow.daemon.save_state", side_effect=[OSError("disk full"), None]),
+            patch("powerflow.daemon.send_notification"),
+            patch("powerflow.daemon.signal.pthread_sigmask") as set_mask,
+            pytest.raises(OSError),
+        ):
+            daemon.run()
+
+        remove_pid.assert_called_once()
+        set_mask.assert_called_once_with(signal.SIG_SETMASK, previous_mask)
+
+
+class TestFailureNotifications:
+    """Tests for coalescing repeated failure notifications."""
+
+    def test_repeated_failures_notify_once_per_interval(self, daemon):
+        """A long outage should not send a notification every cycle."""
+        with (
+            patch("powerflow.daemon.send_notification") as notify,
+            patch("powerflow.daemon.time.monotonic", side_effect=[1000.0, 1900.0, 4700.0]),
+        ):
+            daemon._notify_failure()
+            daemon._notify_failure()  # 15 minutes later: suppressed
+            daemon._notify_failure()  # Over an hour later: sent again
+
+        assert notify.call_count == 2
+
+    def test_recovery_notifies_only_after_failure(self, daemon):
+        """Recovery is announced once, and only if a failure was announced."""
+        with patch("powerflow.daemon.send_notification") as notify:
+            daemon._notify_recovered()
+            assert notify.call_count == 0
+
+            daemon._notify_failure()
+            daemon._notify_recovered()
+            daemon._notify_recovered()
+
+        assert [c.args[0] for c in notify.call_args_list] == [
+            "Power-Flow Sync Failed",
+            "Power-Flow Recovered",
+        ]
+
+
+class TestWaitForExit:
+    """Tests for waiting on the daemon process to exit."""
+
+    def test_returns_true_when_process_exits(self):
+        """Should wake as soon as the process exits, well before the timeout."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+        reaper = threading.Thread(target=proc.wait)
+        reaper.start()
+        try:
+            start = time.monotonic()
+            assert wait_for_exit(proc.pid, 5.0) is True
+            assert time.monotonic() - start < 4.0
+        finally:
+            reaper.join()
+
+    def test_returns_false_on_timeout(self):
+        """A process that keeps running should time out."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            assert wait_for_exit(proc.pid, 0.1) is False
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_already_gone_process(self):
+        """A PID that no longer exists counts as exited."""
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        assert wait_for_exit(proc.pid, 1.0) is True
@@ -1,13 +1,25 @@
 """Tests for daemon fixes (parse_interval validation, atomic state writes)."""
 
 import json
+import os
+import plistlib
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from powerflow.daemon import DEFAULT_INTERVAL_MINUTES, load_state, parse_interval, save_state
+from powerflow.daemon import (
+    DEFAULT_INTERVAL_MINUTES,
+    claim_pid_file,
+    flush_logs,
+    generate_launchd_plist,
+    load_state,
+    parse_interval,
+    save_state,
+    setup_logging,
+    write_pid,
+)
 
 
 class TestParseInterval:
@@ -96,6 +108,20 @@ class TestAtomicStateWrites:
             assert not tmp_file.exists()
             assert state_file.exists()
 
+    def test_save_state_stringifies_unknown_values(self):
+        """Values JSON can't represent natively should be saved as strings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "state.json"
+            with (
+                patch("powerflow.daemon.STATE_FILE", state_file),
+                patch("powerflow.daemon.CONFIG_DIR", Path(tmpdir)),
+            ):
+                save_state({"log": Path(tmpdir) / "daemon.log", "count": 3})
+                state = load_state()
+
+            assert state["log"] == str(Path(tmpdir) / "daemon.log")
+            assert state["count"] == 3
+
     def test_load_state_returns_empty_if_missing(self):
         """Should return empty dict if state file doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -115,3 +141,143 @@ class TestAtomicStateWrites:
                 state = load_state()
 
             assert state == {}
+
+
+class TestLaunchdPlist:
+    """Tests for launchd plist generation."""
+
+    def test_plist_round_trips_with_special_characters(self):
+        """API keys with XML metacharacters should survive unescaped."""
+        with (
+            patch("powerflow.daemon.get_pocket_api_key", return_value='pk_<a&b>"'),
+            patch("powerflow.daemon.get_notion_api_key", return_value="ntn_&amp;"),
+        ):
+            content = generate_launchd_plist(15)
+
+        plist = plistlib.loads(content.encode())
+        assert plist["Label"] == "com.powerflow.sync"
+        assert plist["ProgramArguments"][-1] == "sync"
+        assert plist["StartInterval"] == 900
+        assert plist["RunAtLoad"] is True
+        assert plist["EnvironmentVariables"]["POCKET_API_KEY"] == 'pk_<a&b>"'
+        assert plist["EnvironmentVariables"]["NOTION_API_KEY"] == "ntn_&amp;"
+
+
+class TestPidFileClaim:
+    """Tests for atomic PID file creation."""
+
+    def test_claim_creates_pid_file(self):
+        """First claim should write our PID."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pid_file = Path(tmpdir) / "daemon.pid"
+            with (
+                patch("powerflow.daemon.PID_FILE", pid_file),
+                patch("powerflow.daemon.CONFIG_DIR", Path(tmpdir)),
+            ):
+                assert claim_pid_file() == (True, os.getpid())
+
+            assert pid_file.read_text() == str(os.getpid())
+
+    def test_claim_fails_while_daemon_alive(self):
+        """A PID file held by a live process should not be taken over."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pid_file = Path(tmpdir) / "daemon.pid"
+            pid_file.write_text(str(os.getpid()))  # This process is alive
+            with (
+                patch("powerflow.daemon.PID_FILE", pid_file),
+                patch("powerflow.daemon.CONFIG_DIR", Path(tmpdir)),
+            ):
+                assert claim_pid_file(pid=12345) == (False, os.getpid())
+
+            assert pid_file.read_text() == str(os.getpid())
+
+    def test_claim_replaces_stale_pid_file(self):
+        """A PID file from a dead process should be replaced."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pid_file = Path(tmpdir) / "daemon.pid"
+            pid_file.write_text("not-a-pid")
+            with (
+                patch("powerflow.daemon.PID_FILE", pid_file),
+                patch("powerflow.daemon.CONFIG_DIR", Path(tmpdir)),
+                patch("powerflow.daemon.os.kill", side_effect=ProcessLookupError),
+            ):
+                assert claim_pid_file() == (True, os.getpid())  # Unreadable content
+                pid_file.write_text("99999")
+                assert claim_pid_file() == (True, os.getpid())  # Dead process
+
+    def test_claim_and_write_leave_no_temp_files(self):
+        """The PID file should be the only file left after claiming and rewriting."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pid_file = Path(tmpdir) / "daemon.pid"
+            with (
+                patch("powerflow.daemon.PID_FILE", pid_file),
+                patch("powerflow.daemon.CONFIG_DIR", Path(tmpdir)),
+            ):
+                assert claim_pid_file() == (True, os.getpid())
+                write_pid(12345)
+
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["daemon.pid"]
+            assert pid_file.read_text() == "12345"
+
+    def test_write_pid_replaces_file_atomically(self):
+        """Rewriting the PID should rename a complete file into place."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pid_file = Path(tmpdir) / "daemon.pid"
+            pid_file.write_text("1")
+            with (
+                patch("powerflow.daemon.PID_FILE", pid_file),
+                patch("powerflow.daemon.CONFIG_DIR", Path(tmpdir)),
+                patch("powerflow.daemon.os.replace", wraps=os.replace) as replace,
+            ):
+                write_pid(12345)
+
+            replace.assert_called_once()
+            assert replace.call_args.args[1] == pid_file
+            assert pid_file.read_text() == "12345"
+
+
+class TestDaemonLogging:
+    """Tests for daemon log handler setup."""
+
+    def test_setup_logging_is_idempotent(self):
+        """Repeated setup should keep a single handler for the log file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "daemon.log"
+            with (
+                patch("powerflow.daemon.LOG_FILE", log_file),
+                patch("powerflow.daemon.CONFIG_DIR", Path(tmpdir)),
+            ):
+                logger = setup_logging()
+                first = list(logger.handlers)
+                assert setup_logging().handlers == first
+                assert len(first) == 1
+
+            for handler in logger.handlers[:]:
+                target = handler.target
+                logger.removeHandler(handler)
+                handler.close()
+                target.close()
+
+    def test_info_records_are_buffered_until_flush(self):
+        """INFO lines reach the file on flush; errors are written at once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "daemon.log"
+            with (
+                patch("powerflow.daemon.LOG_FILE", log_file),
+                patch("powerflow.daemon.CONFIG_DIR", Path(tmpdir)),
+            ):
+                logger = setup_logging()
+                logger.info("sync started")
+                assert "sync started" not in log_file.read_text()
+
+                flush_logs(logger)
+                assert "sync started" in log_file.read_text()
+
+                logger.error("sync failed")
+                assert "sync failed" in log_file.read_text()
+
+            for handler in logger.handlers[:]:
+                target = handler.target
+                logger.removeHandler(handler)
+                handler.close()
+                target.close()
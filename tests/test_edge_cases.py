@@ -34,6 +34,51 @@ class TestEmptyData:
         # Should NOT call batch_check if no items
         mock_notion.batch_check_existing_pocket_ids.assert_not_called()
 
+    def test_sync_skips_dedup_query_when_nothing_is_ready(self):
+        """Recordings still in AI processing should not trigger a Notion query."""
+        mock_pocket = MagicMock()
+        mock_pocket.fetch_recordings.return_value = [
+            Recording(id="1", title="Processing"),
+            Recording(id="2", title="Also processing"),
+        ]
+        mock_notion = MagicMock()
+        mock_config = MagicMock()
+        mock_config.is_configured = True
+        mock_config.notion.database_id = "db123"
+        mock_config.notion.property_map = {"pocket_id": "Inbox ID"}
+        mock_config.pocket.last_sync = None
+
+        engine = SyncEngine(mock_pocket, mock_notion, mock_config)
+        result = engine.sync()
+
+        assert result.pending == 2
+        assert result.created == 0
+        mock_notion.batch_check_existing_pocket_ids.assert_not_called()
+        mock_config.update_last_sync.assert_not_called()
+
+    def test_sync_dedup_query_only_checks_ready_items(self):
+        """Only recordings with completed AI processing are checked for duplicates."""
+        mock_pocket = MagicMock()
+        mock_pocket.fetch_recordings.return_value = [
+            Recording(id="ready", title="Ready", summary="Done"),
+            Recording(id="busy", title="Processing"),
+        ]
+        mock_notion = MagicMock()
+        mock_notion.batch_check_existing_pocket_ids.return_value = set()
+        mock_config = MagicMock()
+        mock_config.is_configured = True
+        mock_config.notion.database_id = "db123"
+        mock_config.notion.property_map = {"pocket_id": "Inbox ID", "title": "Name"}
+        mock_config.pocket.last_sync = None
+
+        engine = SyncEngine(mock_pocket, mock_notion, mock_config)
+        result = engine.sync()
+
+        assert result.created == 1
+        assert result.pending == 1
+        checked_ids = mock_notion.batch_check_existing_pocket_ids.call_args[0][1]
+        assert checked_ids == ["pocket:recording:ready"]
+
     def test_recording_with_all_none_optional_fields(self):
         """Recording should handle all optional fields being None."""
         rec = Recording(
@@ -159,7 +204,7 @@ class TestAPIErrors:
         """Sync should handle Notion dedup check errors gracefully."""
         mock_pocket = MagicMock()
         mock_pocket.fetch_recordings.return_value = [
-            Recording(id="1", title="Test")
+            Recording(id="1", title="Test", summary="Ready")  # Only ready items are checked
         ]
         mock_notion = MagicMock()
         mock_notion.batch_check_existing_pocket_ids.side_effect = (
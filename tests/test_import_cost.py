@@ -0,0 +1,30 @@
+"""Tests for cold-start import cost of the entry point modules."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Modules that pull in the HTTP stack and should only load when a command needs them
+HEAVY_MODULES = ("requests", "powerflow.notion", "powerflow.pocket", "powerflow.sync")
+
+
+@pytest.mark.parametrize("module", ["powerflow.cli", "powerflow.daemon"])
+def test_import_does_not_load_http_stack(module):
+    """Importing an entry point should not import requests or the API clients."""
+    code = (
+        f"import sys, {module}; "
+        f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]; "
+        "print(','.join(loaded))"
+    )
+    src_dir = Path(__file__).resolve().parent.parent / "src"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src_dir)},
+    )
+    assert result.stdout.strip() == ""
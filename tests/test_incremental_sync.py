@@ -1,9 +1,13 @@
 """Tests for incremental sync functionality."""
 
+import json
 from unittest.mock import MagicMock
 
+import pytest
+import requests
+
 from powerflow.models import Recording
-from powerflow.sync import SyncEngine
+from powerflow.sync import SyncEngine, clear_pending_cache, get_engine
 
 
 class TestIncrementalSync:
@@ -105,3 +109,129 @@ class TestIncrementalSync:
         call_args = mock_pocket.fetch_recordings.call_args
         since = call_args.kwargs.get("since")
         assert since is None
+
+
+class TestPendingCountCache:
+    """Tests for TTL caching of get_pending_count."""
+
+    @pytest.fixture(autouse=True)
+    def cache_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "pending_cache.json"
+        monkeypatch.setattr("powerflow.sync.PENDING_CACHE_FILE", path)
+        return path
+
+    def _engine(self, last_sync=None):
+        mock_pocket = MagicMock()
+        mock_pocket.fetch_recordings.return_value = [
+            Recording(id="1", title="Ready", summary="Done"),
+            Recording(id="2", title="Pending"),
+        ]
+        mock_notion = MagicMock()
+        mock_notion.batch_check_existing_pocket_ids.return_value = set()
+        mock_config = MagicMock()
+        mock_config.is_configured = True
+        mock_config.notion.database_id = "db123"
+        mock_config.notion.property_map = {"pocket_id": "Inbox ID"}
+        mock_config.pocket.last_sync = last_sync
+        return SyncEngine(mock_pocket, mock_notion, mock_config)
+
+    def test_repeated_calls_reuse_cached_count(self):
+        """A second call within the TTL should not hit the APIs."""
+        engine = self._engine()
+
+        assert engine.get_pending_count() == 1
+        assert engine.get_pending_count() == 1
+        engine.pocket.fetch_recordings.assert_called_once()
+
+    def test_cache_is_shared_across_engines(self):
+        """Fresh engines for the same database reuse the count."""
+        first = self._engine()
+        second = self._engine()
+
+        first.get_pending_count()
+        assert second.get_pending_count() == 1
+        second.pocket.fetch_recordings.assert_not_called()
+
+    def test_cache_survives_on_disk(self, cache_file):
+        """The count should be read back from the cache file."""
+        self._engine().get_pending_count()
+        assert json.loads(cache_file.read_text())["count"] == 1
+
+        engine = self._engine()
+        engine.get_pending_count()
+        engine.pocket.fetch_recordings.assert_not_called()
+
+    def test_stale_count_is_refreshed(self, cache_file):
+        """A count older than max_age should not be reused."""
+        self._engine().get_pending_count()
+        cached = json.loads(cache_file.read_text())
+        cached["checked_at"] -= 61
+        cache_file.write_text(json.dumps(cached))
+
+        engine = self._engine()
+        engine.get_pending_count()
+        engine.pocket.fetch_recordings.assert_called_once()
+
+    def test_corrupt_cache_is_a_miss(self, cache_file):
+        """An unreadable cache file should fall back to the APIs."""
+        cache_file.write_text("not json")
+        engine = self._engine()
+
+        assert engine.get_pending_count() == 1
+        engine.pocket.fetch_recordings.assert_called_once()
+
+    def test_clear_pending_cache(self, cache_file):
+        """Clearing should remove the cache file."""
+        self._engine().get_pending_count()
+        clear_pending_cache()
+        assert not cache_file.exists()
+
+    def test_max_age_zero_forces_refresh(self):
+        """max_age=0 should always query the APIs."""
+        engine = self._engine()
+
+        engine.get_pending_count()
+        engine.get_pending_count(max_age=0)
+        assert engine.pocket.fetch_recordings.call_count == 2
+
+    def test_new_last_sync_misses_cache(self):
+        """A different last_sync timestamp should not reuse the old count."""
+        self._engine().get_pending_count()
+        engine = self._engine(last_sync="2026-02-06T10:00:00+00:00")
+
+        engine.get_pending_count()
+        engine.pocket.fetch_recordings.assert_called_once()
+
+    def test_errors_are_not_cached(self):
+        """Failed checks should be retried on the next call."""
+        engine = self._engine()
+        engine.notion.batch_check_existing_pocket_ids.side_effect = requests.RequestException()
+
+        assert engine.get_pending_count() == -1
+        engine.notion.batch_check_existing_pocket_ids.side_effect = None
+        assert engine.get_pending_count() == 1
+
+
+class TestGetEngine:
+    """Tests for the process-wide engine used by the daemon and CLI."""
+
+    @pytest.fixture(autouse=True)
+    def no_engine(self, monkeypatch):
+        monkeypatch.setattr("powerflow.sync._ENGINE", None)
+
+    def test_reuses_clients_for_same_keys(self):
+        """Clients should be kept between calls with the same API keys."""
+        first = get_engine(MagicMock(), "pk", "ntn")
+        config = MagicMock()
+        second = get_engine(config, "pk", "ntn")
+
+        assert second.pocket is first.pocket
+        assert second.notion is first.notion
+        assert second.config is config
+
+    def test_rebuilds_clients_when_key_changes(self):
+        """A new API key should get a new client."""
+        first = get_engine(MagicMock(), "pk", "ntn")
+        second = get_engine(MagicMock(), "pk", "ntn-rotated")
+
+        assert second.notion is not first.notion
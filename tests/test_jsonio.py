@@ -0,0 +1,68 @@
+"""Tests for the shared JSON helpers."""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from powerflow.utils.jsonio import json_dumps, json_loads
+
+
+@pytest.fixture(params=["json", "orjson"])
+def backend(request, monkeypatch):
+    """Run a test against both the stdlib and orjson backends."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("powerflow.utils.jsonio.orjson", None)
+    return request.param
+
+
+class TestJsonDumps:
+    """Tests for json_dumps."""
+
+    def test_compact_output(self, backend):
+        """Compact output should have no whitespace and keep non-ASCII text."""
+        data = {"name": "Boîte", "items": [1, 2]}
+        assert json_dumps(data, indent=False) == '{"name":"Boîte","items":[1,2]}'.encode()
+
+    def test_indented_output(self, backend):
+        """Default output should use 2-space indentation."""
+        assert json_dumps({"a": 1}) == b'{\n  "a": 1\n}'
+
+    @pytest.mark.parametrize("indent", [True, False])
+    def test_non_ascii_written_as_utf8(self, backend, indent):
+        """Non-ASCII text should be written raw, not escaped, and read back intact."""
+        data = {"name": "Boîte de réception 📥"}
+        raw = json_dumps(data, indent=indent)
+        assert "Boîte de réception 📥".encode() in raw
+        assert json_loads(raw) == data
+
+    def test_dates_use_iso_format(self, backend):
+        """Dates and datetimes should be written as ISO 8601."""
+        data = {
+            "at": datetime(2026, 2, 14, 10, 30, tzinfo=timezone.utc),
+            "on": date(2026, 2, 14),
+        }
+        assert json_dumps(data, indent=False) == (
+            b'{"at":"2026-02-14T10:30:00+00:00","on":"2026-02-14"}'
+        )
+
+    def test_non_str_keys_are_stringified(self, backend):
+        """Int and None keys should become strings, as with the stdlib."""
+        data = {1: "one", None: "none"}
+        assert json_dumps(data, indent=False) == b'{"1":"one","null":"none"}'
+
+    def test_default_handles_unknown_types(self, backend):
+        """The default callback should serialize values JSON can't represent."""
+        assert json_dumps({"path": object}, default=lambda _: "x", indent=False) == (
+            b'{"path":"x"}'
+        )
+
+
+class TestJsonLoads:
+    """Tests for json_loads."""
+
+    def test_round_trip(self, backend):
+        """Parsed bytes should match the original data."""
+        data = {"name": "Boîte", "items": [1, 2], "nested": {"ok": True}}
+        assert json_loads(json_dumps(data)) == data
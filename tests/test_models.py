@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 
-from powerflow.models import ActionItem, Recording, SyncResult
+from powerflow.models import ActionItem, Recording, SyncResult, property_builder
 
 
 class TestActionItem:
@@ -41,6 +41,22 @@ class TestActionItem:
         item = ActionItem(label="Buy groceries", priority="High")
         assert item.to_checklist_text() == "☐ Buy groceries [High]"
 
+    def test_to_checklist_text_with_priority_and_due_date(self):
+        """Test checklist text with priority and due date."""
+        item = ActionItem(
+            label="Buy groceries",
+            priority="High",
+            due_date=datetime(2024, 3, 5, tzinfo=timezone.utc),
+        )
+        assert item.to_checklist_text() == "☐ Buy groceries [High] (due: Mar 05)"
+
+    def test_due_date_format_matches_strftime(self):
+        """Month/day formatting should match strftime('%b %d') for every month."""
+        for month in range(1, 13):
+            due = datetime(2024, month, 9, tzinfo=timezone.utc)
+            item = ActionItem(label="x", due_date=due)
+            assert item.to_checklist_text() == f"☐ x (due: {due.strftime('%b %d')})"
+
 
 class TestRecording:
     """Tests for Recording model."""
@@ -68,6 +84,11 @@ class TestRecording:
         assert len(rec.display_title) <= 60
         assert rec.display_title.endswith("...")
 
+    def test_display_title_summary_without_period(self):
+        """A summary with no sentence break is used whole."""
+        rec = Recording(id="abc", title="   ", summary="  Quick note  ")
+        assert rec.display_title == "Quick note"
+
     def test_display_title_default(self):
         """Test display_title default."""
         rec = Recording(id="abc")
@@ -146,6 +167,77 @@ class TestRecording:
         tags = props["Tags"]["multi_select"]
         assert len(tags) == 2  # work + meeting
 
+    def test_property_maps_do_not_leak_between_calls(self):
+        """Cached builders must follow each call's own property map."""
+        rec = Recording(id="abc", title="T", pocket_url="https://example.com")
+
+        first = rec.to_notion_properties({"title": "Name", "source_url": "Source"})
+        second = rec.to_notion_properties({"title": "Task", "pocket_id": "Key"})
+
+        assert set(first) == {"Name", "Inbox ID", "Source"}
+        assert set(second) == {"Task", "Key"}
+
+    def test_unhashable_property_map_values(self):
+        """Unusual map values should still work, just without caching."""
+        rec = Recording(id="abc", title="T")
+        props = rec.to_notion_properties({"title": "Name", "extra": ["unused"]})
+        assert props["Name"]["title"][0]["text"]["content"] == "T"
+
+    def test_null_optional_properties_are_skipped(self):
+        """Optional properties mapped to null in config should be left out."""
+        rec = Recording(id="abc", title="T", pocket_url="https://example.com", tags=["work"])
+        props = rec.to_notion_properties({"title": "Name", "source_url": None, "tags": None})
+        assert set(props) == {"Name", "Inbox ID"}
+
+    def test_property_builder_matches_per_recording_call(self):
+        """A builder resolved once should produce the same properties."""
+        property_map = {"title": "Name", "pocket_id": "ID", "tags": "Tags"}
+        build = property_builder(property_map)
+        assert property_builder(dict(property_map)) is build
+
+        rec = Recording(id="abc", title="T", tags=["work"])
+        assert build(rec) == rec.to_notion_properties(property_map)
+
+
+class TestMindMapTree:
+    """Tests for Recording._build_mind_map_tree()."""
+
+    def _titles(self, rec):
+        return [
+            b["bulleted_list_item"]["rich_text"][0]["text"]["content"]
+            for b in rec._build_mind_map_tree()
+        ]
+
+    def test_depth_first_order_with_indents(self):
+        """Children follow their parent, indented by depth, in input order."""
+        rec = Recording(id="1", mind_map=[
+            {"node_id": "r", "parent_node_id": "r", "title": "Root"},
+            {"node_id": "a", "parent_node_id": "r", "title": "A"},
+            {"node_id": "b", "parent_node_id": "r", "title": "B"},
+            {"node_id": "a1", "parent_node_id": "a", "title": "A1"},
+        ])
+        assert self._titles(rec) == ["Root", "↳ A", "    ↳ A1", "↳ B"]
+
+    def test_deep_tree_does_not_hit_recursion_limit(self):
+        """Very deep outlines should not raise RecursionError."""
+        nodes = [{"node_id": "0", "parent_node_id": "0", "title": "n0"}]
+        nodes += [
+            {"node_id": str(i), "parent_node_id": str(i - 1), "title": f"n{i}"}
+            for i in range(1, 3000)
+        ]
+        assert len(Recording(id="1", mind_map=nodes)._build_mind_map_tree()) == 3000
+
+    def test_cycle_terminates(self):
+        """A node listed as its own ancestor should be output once, not loop."""
+        rec = Recording(id="1", mind_map=[
+            {"node_id": "r", "parent_node_id": "r", "title": "Root"},
+            {"node_id": "a", "parent_node_id": "r", "title": "A"},
+            {"node_id": "r", "parent_node_id": "a", "title": "Back to root"},
+        ])
+        titles = self._titles(rec)
+        assert titles[:2] == ["Root", "↳ A"]
+        assert len(titles) == 3
+
 
 class TestRecordingIcon:
     """Tests for Recording.get_icon() method."""
@@ -202,6 +294,12 @@ class TestSyncResult:
         assert "Skipped: 3" in str(result)
         assert "Failed: 2" in str(result)
 
+    def test_sync_result_has_no_instance_dict(self):
+        """Slotted results carry no per-instance __dict__."""
+        result = SyncResult()
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(ActionItem(label="Do something"), "__dict__")
+
 
 class TestSummaryCompletion:
     """Tests for is_summary_complete property."""
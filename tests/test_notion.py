@@ -1,7 +1,9 @@
 """Tests for Notion API client."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+import pytest
 import requests
 
 from powerflow.notion import NOTION_RETRY_CONFIG, NotionClient
@@ -37,6 +39,50 @@ class TestNotionClient:
         assert client.timeout == 60.0
 
 
+class TestNotionRequestBody:
+    """Tests for request and response body encoding."""
+
+    def test_json_body_is_sent_pre_encoded(self):
+        """JSON payloads should be encoded once and sent as compact bytes."""
+        client = NotionClient("test-key")
+        client._rate_limiter = MagicMock()
+        response = MagicMock(status_code=200, content=b'{"ok": true}')
+        client.session.request = MagicMock(return_value=response)
+
+        payload = {"properties": {"Name": {"title": [{"text": {"content": "Café"}}]}}}
+        assert client._request("POST", "/pages", json=payload) == {"ok": True}
+
+        kwargs = client.session.request.call_args[1]
+        assert "json" not in kwargs
+        assert isinstance(kwargs["data"], bytes)
+        assert b"\n" not in kwargs["data"]
+        assert json.loads(kwargs["data"]) == payload
+
+    def test_invalid_json_response_raises_request_exception(self):
+        """Unparseable bodies should raise requests' JSONDecodeError, as before."""
+        client = NotionClient("test-key")
+        client._rate_limiter = MagicMock()
+        response = MagicMock(status_code=200, content=b"<html>oops</html>")
+        client.session.request = MagicMock(return_value=response)
+
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            client._request("GET", "/databases/db123")
+
+    def test_rate_limited_response_throttles_limiter(self):
+        """A 429 should slow the limiter; the following success should recover it."""
+        client = NotionClient("test-key")
+        client._rate_limiter = MagicMock()
+        limited = MagicMock(status_code=429, headers={"Retry-After": "0"})
+        limited.raise_for_status.side_effect = requests.exceptions.HTTPError(response=limited)
+        ok = MagicMock(status_code=200, content=b"{}")
+        client.session.request = MagicMock(side_effect=[limited, ok])
+
+        assert client._request("GET", "/databases/db123") == {}
+
+        client._rate_limiter.throttle.assert_called_once()
+        client._rate_limiter.recover.assert_called_once()
+
+
 class TestNotionRetryConfig:
     """Tests for Notion retry configuration."""
 
@@ -98,6 +144,42 @@ class TestNotionClientMethods:
         assert "Name" in schema
         assert "Status" in schema
 
+    def test_get_database_schema_is_cached(self):
+        """Repeated schema reads should reuse the first response."""
+        client = NotionClient("test-key")
+        client._request = MagicMock(return_value={"properties": {"Name": {"type": "title"}}})
+
+        first = client.get_database_schema("db123")
+        second = client.get_database_schema("db123")
+
+        assert first == second == {"Name": {"type": "title"}}
+        client._request.assert_called_once()
+
+    def test_get_database_schema_cache_expires(self):
+        """A schema older than the TTL should be fetched again."""
+        client = NotionClient("test-key")
+        client._request = MagicMock(return_value={"properties": {}})
+
+        with patch("powerflow.notion.SCHEMA_CACHE_TTL", 0.0):
+            client.get_database_schema("db123")
+            client.get_database_schema("db123")
+
+        assert client._request.call_count == 2
+
+    def test_create_properties_refreshes_cached_schema(self):
+        """Creating properties should update the cached schema from the response."""
+        client = NotionClient("test-key")
+        client._request = MagicMock(side_effect=[
+            {"properties": {"Name": {}}},
+            {"properties": {"Name": {}, "Tags": {}}},
+        ])
+
+        client.get_database_schema("db123")
+        client.create_properties("db123", [("Tags", "multi_select")])
+
+        assert client.get_database_schema("db123") == {"Name": {}, "Tags": {}}
+        assert client._request.call_count == 2
+
     def test_test_connection_success(self):
         """test_connection should return True on success."""
         client = NotionClient("test-key")
@@ -148,3 +230,55 @@ class TestNotionClientMethods:
         with patch("powerflow.notion.logger") as mock_logger:
             client.create_property("db123", "Custom", "unknown_type")
             mock_logger.warning.assert_called()
+
+    def test_create_properties_sends_one_patch(self):
+        """Several properties should be created with a single request."""
+        client = NotionClient("test-key")
+        client._request = MagicMock(return_value={})
+
+        client.create_properties("db123", [("Inbox ID", "rich_text"), ("Tags", "multi_select")])
+
+        client._request.assert_called_once()
+        method, endpoint = client._request.call_args[0]
+        assert (method, endpoint) == ("PATCH", "/databases/db123")
+        assert client._request.call_args[1]["json"] == {
+            "properties": {
+                "Inbox ID": {"rich_text": {}},
+                "Tags": {"multi_select": {"options": []}},
+            }
+        }
+
+    def test_ensure_properties_exist_batches_missing(self):
+        """Only missing properties should be created, in one request."""
+        client = NotionClient("test-key")
+        client.get_database_schema = MagicMock(return_value={"Name": {}, "Source": {}})
+        client.create_properties = MagicMock(return_value={})
+
+        created = client.ensure_properties_exist(
+            "db123", {"Source": "url", "Inbox ID": "rich_text", "Tags": "multi_select"}
+        )
+
+        assert created == ["Inbox ID", "Tags"]
+        client.create_properties.assert_called_once_with(
+            "db123", [("Inbox ID", "rich_text"), ("Tags", "multi_select")]
+        )
+
+    def test_page_exists_stops_after_first_page(self):
+        """Existence checks should not follow pagination cursors."""
+        client = NotionClient("test-key")
+        client._request = MagicMock(return_value={
+            "results": [{"id": "page1"}],
+            "has_more": True,
+            "next_cursor": "cursor1",
+        })
+
+        assert client.page_exists_by_pocket_id("db123", "pocket:1:0") is True
+        client._request.assert_called_once()
+
+    def test_ensure_properties_exist_with_nothing_required(self):
+        """An empty requirement should not fetch the schema."""
+        client = NotionClient("test-key")
+        client._request = MagicMock()
+
+        assert client.ensure_properties_exist("db123", {}) == []
+        client._request.assert_not_called()
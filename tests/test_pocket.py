@@ -32,6 +32,18 @@ class TestPocketClient:
         client = PocketClient("test-api-key", timeout=60.0)
         assert client.timeout == 60.0
 
+    def test_connection_pool_fits_workers(self):
+        """Pool should hold a kept-alive connection for every worker."""
+        client = PocketClient("test-api-key", max_workers=32)
+        adapter = client.session.get_adapter("https://public.heypocketai.com")
+        assert adapter._pool_maxsize == 32
+
+    def test_context_manager_closes_session(self):
+        """Leaving the with block should close the session."""
+        with PocketClient("test-api-key") as client:
+            client.session.close = MagicMock()
+        client.session.close.assert_called_once()
+
 
 class TestPocketRetryConfig:
     """Tests for Pocket retry configuration."""
@@ -151,6 +163,25 @@ class TestPocketClientMethods:
         assert len(recordings) == 1
         assert recordings[0].id == "rec2"
 
+    def test_fetch_recordings_concurrent_keeps_order_and_counts_failures(self):
+        """Should fetch details concurrently, keep list order, and skip failures."""
+        client = PocketClient("test-key", max_workers=3)
+        client.get_recordings_list = MagicMock(
+            return_value=[{"id": f"rec{i}"} for i in range(5)]
+        )
+
+        def details(recording_id):
+            if recording_id == "rec2":
+                raise requests.ConnectionError("boom")
+            return {"id": recording_id, "createdAt": "2026-02-15T10:00:00Z"}
+
+        client.get_recording_details = MagicMock(side_effect=details)
+
+        recordings = client.fetch_recordings()
+
+        assert [r.id for r in recordings] == ["rec0", "rec1", "rec3", "rec4"]
+        assert client.get_recording_details.call_count == 5
+
     def test_parse_recording_handles_missing_fields(self):
         """Should handle recordings with missing optional fields."""
         client = PocketClient("test-key")
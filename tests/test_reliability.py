@@ -2,6 +2,8 @@
 
 import threading
 import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import Mock
 
 import pytest
@@ -13,6 +15,7 @@ from powerflow.utils.reliability import (
     RetryConfig,
     calculate_backoff,
     is_retriable_error,
+    parse_retry_after,
     with_retry,
     with_timeout,
 )
@@ -202,6 +205,33 @@ class TestWithRetry:
         assert len(retries) == 2
 
 
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_delta_seconds(self):
+        assert parse_retry_after("5", max_delay=60) == 5.0
+
+    def test_missing_header(self):
+        assert parse_retry_after(None, max_delay=60) is None
+        assert parse_retry_after("", max_delay=60) is None
+
+    def test_http_date(self):
+        """HTTP-date values should become a delay from now."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(when, usegmt=True), max_delay=60)
+        assert 25 <= delay <= 30
+
+    def test_past_http_date_is_zero(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", max_delay=60) == 0.0
+
+    def test_clamped_to_max_delay(self):
+        assert parse_retry_after("3600", max_delay=60) == 60
+
+    def test_garbage_is_ignored(self):
+        assert parse_retry_after("soon", max_delay=60) is None
+        assert parse_retry_after("nan", max_delay=60) is None
+
+
 class TestRateLimiter:
     """Tests for RateLimiter."""
 
@@ -275,6 +305,61 @@ class TestRateLimiter:
         # Allow small variance due to timing (10-12)
         assert 9 <= len(acquired) <= 12, f"Expected ~10 tokens, got {len(acquired)}"
 
+    def test_timeout_fails_fast_when_slot_is_too_far(self):
+        """A wait that can't be met within the timeout should not sleep."""
+        limiter = RateLimiter(calls_per_second=1, burst_size=1)
+        limiter.acquire()
+
+        start = time.monotonic()
+        assert limiter.wait(timeout=0.2) is False
+        assert time.monotonic() - start < 0.1
+
+    def test_concurrent_waiters_are_spaced_at_rate(self):
+        """Blocked callers should each get their own slot, one interval apart."""
+        limiter = RateLimiter(calls_per_second=20, burst_size=1)
+        limiter.acquire()
+        finished = []
+        lock = threading.Lock()
+
+        def wait_for_token():
+            limiter.wait()
+            with lock:
+                finished.append(time.monotonic())
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=wait_for_token) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Three reserved slots at 20/sec end ~0.15s after the first token
+        assert time.monotonic() - start >= 0.13
+        assert len(finished) == 3
+
+    def test_throttle_halves_rate_down_to_floor(self):
+        """throttle() should halve the rate, never below the minimum."""
+        limiter = RateLimiter(calls_per_second=4, min_calls_per_second=1)
+
+        limiter.throttle()
+        assert limiter.calls_per_second == 2
+        limiter.throttle()
+        limiter.throttle()
+        assert limiter.calls_per_second == 1
+
+    def test_recover_steps_back_up_to_max(self):
+        """recover() should add the rate back gradually, capped at the maximum."""
+        limiter = RateLimiter(calls_per_second=3)
+        limiter.throttle()
+        assert limiter.calls_per_second == 1.5
+
+        limiter.recover()
+        assert limiter.calls_per_second == pytest.approx(1.8)
+
+        for _ in range(20):
+            limiter.recover()
+        assert limiter.calls_per_second == 3
+
 
 class TestWithTimeout:
     """Tests for with_timeout."""